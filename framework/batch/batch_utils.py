@@ -20,13 +20,14 @@ sys.path.append(os.path.abspath(
 from api.loader import LoadManager
 
 # Database
-from realsim.database import Database
+from realsim.database import Database, replayable
 
 # Generators
 from realsim.generators.abstract import AbstractGenerator
 from realsim.generators.random import RandomGenerator
 from realsim.generators.keysdict import KeysDictGenerator
 from realsim.generators.keyslist import KeysListGenerator
+from realsim.generators.trace import TraceGenerator
 
 # Distributions
 from realsim.generators.distribution.idistribution import IDistribution
@@ -46,9 +47,13 @@ from realsim.scheduler.coschedulers.ranks.random import RandomRanksCoscheduler
 
 # Logger
 from realsim.logger.logger import Logger
+from realsim.logger.metrics import OnlineMetrics
+
+# Actions served by the online metrics without the events of the jobs
+ONLINE_ACTIONS = ["get_metrics"]
 
 # ComputeEngine
-from realsim.compengine import ComputeEngine
+from realsim.compengine import ComputeEngine, VectorComputeEngine
 
 def import_module(path):
     mod_name = os.path.basename(path).replace(".py", "")
@@ -67,7 +72,8 @@ class BatchCreator:
         self.__impl_generators = {
             RandomGenerator.name: RandomGenerator,
             KeysDictGenerator.name: KeysDictGenerator,
-            KeysListGenerator.name: KeysListGenerator
+            KeysListGenerator.name: KeysListGenerator,
+            TraceGenerator.name: TraceGenerator
         }
 
         # Ready to use schedulers implementing the Distribution interface
@@ -85,6 +91,12 @@ class BatchCreator:
             RandomRanksCoscheduler.name: RandomRanksCoscheduler
         }
         
+        # Ready to use compute engines
+        self.__impl_compengines = {
+            "default": ComputeEngine,
+            "vector": VectorComputeEngine
+        }
+
         # Load the configuration file
         with open(path_to_script, "r") as fd:
             #data = json_loads(fd.read())
@@ -97,6 +109,10 @@ class BatchCreator:
             self.__project_workloads = data["workloads"]
             self.__project_schedulers = data["schedulers"]
             self.__project_actions = data["actions"] if "actions" in data else dict()
+            self.__project_compengine = data["compute-engine"] if "compute-engine" in data else "default"
+
+            if self.__project_compengine not in self.__impl_compengines:
+                raise RuntimeError(f"Compute engine of type {self.__project_compengine} does not exist")
 
         # If using MPI store modules that should be exported to other MPI procs
         self.mods_export = list()
@@ -171,8 +187,9 @@ class BatchCreator:
                     except:
                         raise RuntimeError(f"The name {gen_type} of the generator provided does not exist")
 
-                # Create instance of generator
-                gen_inst = gen_cls(load_manager=lm)
+                # Create instance of generator; any options are passed to
+                # its constructor
+                gen_inst = gen_cls(load_manager=lm, **generator.get("options", dict()))
 
                 if "repeat" in workload:
                     repeat = int(workload["repeat"])
@@ -181,8 +198,10 @@ class BatchCreator:
 
                 for _ in range(repeat):
 
-                    # Generate the workload
-                    gen_workload = gen_inst.generate_jobs_set(gen_arg)
+                    # Generate the workload; it is replayed by the database of
+                    # every scheduler, so a one-shot stream of jobs is
+                    # materialized once
+                    gen_workload = replayable(gen_inst.generate_jobs_set(gen_arg))
 
                     # Check if a transformer distribution is provided by the user
                     if "distribution" in generator:
@@ -214,7 +233,8 @@ class BatchCreator:
 
                     nodes = int(workload["cluster"]["nodes"])
                     socket_conf = tuple(workload["cluster"]["socket-conf"])
-                    self.__workloads.append((gen_workload, heatmap, nodes, socket_conf))
+                    core_allocator = workload["cluster"].get("core-allocator", "procset")
+                    self.__workloads.append((gen_workload, heatmap, nodes, socket_conf, core_allocator))
 
             else:
                 raise RuntimeError("A generator was not provided")
@@ -317,15 +337,14 @@ class BatchCreator:
 
         # Create the ranks
         self.ranks = list()
-        for idx, [workload, heatmap, nodes, socket_conf] in enumerate(self.__workloads):
+        for idx, [workload, heatmap, nodes, socket_conf, core_allocator] in enumerate(self.__workloads):
             for sched_cls in self.__schedulers:
 
-                # Create a database instance
+                # Create a database instance; it is set up in the worker
                 database = Database(workload, heatmap)
-                database.setup()
 
                 # Create a cluster instance
-                cluster = Cluster(nodes, socket_conf)
+                cluster = Cluster(nodes, socket_conf, core_allocator)
 
                 # Create a scheduler instance
                 scheduler = sched_cls()
@@ -334,16 +353,17 @@ class BatchCreator:
                     for opt, val in self.__project_schedulers["general-options"].items():
                         scheduler.__dict__[opt] = val
 
-                # Create a logger instance
-                logger = Logger(debug=False)
+                # Set actions for this simulation
+                actions = self.__actions[idx][sched_cls.name]
+
+                # Create a logger instance; the events of the jobs are
+                # retained only for the actions that need them
+                retain = any(action not in ONLINE_ACTIONS for action in actions)
+                logger = Logger(debug=False, retain=retain, sinks=[OnlineMetrics()])
 
                 # Create a compute engine instance
-                compengine = ComputeEngine(database, cluster, scheduler, logger)
-                compengine.setup_preloaded_jobs()
+                compengine = self.__impl_compengines[self.__project_compengine](database, cluster, scheduler, logger)
                 # compengine = ParallelComputeEngine().set_db(database).set_cluster(cluster).set_scheduler(scheduler).set_logger(logger).setup()
                 # compengine.setup_preloaded_jobs()
 
-                # Set actions for this simulation
-                actions = self.__actions[idx][sched_cls.name]
-                
                 self.ranks.append((idx, database, cluster, scheduler, logger, compengine, actions, self.__extra_features))
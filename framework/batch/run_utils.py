@@ -1,9 +1,11 @@
 import os
+import json
 from plotly.io import from_json
 from types import MethodType
 
 def __get_gantt_representation(self):
-    res = self.__class__.get_gantt_representation(self) # Have to call this way to avoid infinite recursion
+    compact = getattr(self, "compact", False)
+    res = self.__class__.get_gantt_representation(self, compact=compact, pixels=1024) # Have to call this way to avoid infinite recursion
     fig = from_json(res)
     fig.update_layout(width=2048, height=1024)
 
@@ -20,6 +22,15 @@ def __get_workload(self):
     with open(f"{output_path}/workload_{self.sim_id}_{self.scheduler.name.lower().replace(' ', '_')}.csv", "w") as fd:
         fd.write(res)
 
+def __get_metrics(self):
+    res = self.__class__.get_metrics(self)
+
+    output_path = os.path.abspath(f"{self.metrics_dir}")
+    os.makedirs(output_path, exist_ok=True)
+
+    with open(f"{output_path}/metrics_{self.sim_id}_{self.scheduler.name.lower().replace(' ', '_')}.json", "w") as fd:
+        json.dump(res, fd, indent=4)
+
 def __get_animated_cluster(self):
     res = self.__class__.get_animated_cluster(self)
     fig = from_json(res)
@@ -31,6 +42,7 @@ def patch(logger, extra_features):
     logger.get_gantt_representation = MethodType(__get_gantt_representation, logger)
     logger.get_workload = MethodType(__get_workload, logger)
     logger.get_animated_cluster = MethodType(__get_animated_cluster, logger)
+    logger.get_metrics = MethodType(__get_metrics, logger)
 
 
 def simulation(sim_batch):
@@ -38,11 +50,15 @@ def simulation(sim_batch):
     """
     idx, database, cluster, scheduler, logger, compengine, actions, extra_features = sim_batch
 
+    # The stream of jobs of the database is opened in the worker
+    database.setup()
+    compengine.setup_preloaded_jobs()
+
     cluster.setup()
     scheduler.setup()
     logger.setup()
 
-    while database.preloaded_queue != [] or cluster.waiting_queue != [] or cluster.execution_list != []:
+    while database.has_pending_arrivals() or cluster.waiting_queue != [] or cluster.execution_list != []:
         compengine.sim_step()
 
     # If there are actions provided for this rank
@@ -5,6 +5,8 @@ from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from numpy.random import seed, randint, exponential
 from time import time_ns, time
 from datetime import timedelta
+from importlib import import_module
+from threading import Lock
 import os
 import sys
 import base64
@@ -22,6 +24,11 @@ from realsim.simulator import Simulation
 from .generator import mapping
 from .schedulers import stored_modules
 
+# Long-lived pool of workers shared by all the runs of the dashboard server
+_pool = None
+_pool_key = None
+_pool_lock = Lock()
+
 
 elem_run = dbc.Container([
 
@@ -145,7 +152,34 @@ clientside_callback(
 
 )
 
-def parallel_simulations(par_inp):
+def worker_pool() -> ProcessPoolExecutor:
+    """The pool of workers of the dashboard server; it is created once and
+    recreated only when the code of the scheduler modules changes, so that
+    the workers never run stale schedulers
+    """
+    global _pool, _pool_key
+
+    key = tuple(sorted((mod_name, mod_dict["lastmod"])
+                       for mod_name, mod_dict in stored_modules.items()))
+
+    with _pool_lock:
+        if _pool is None or key != _pool_key:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                        initializer=preload_worker,
+                                        initargs=([mod_name for mod_name, _ in key],))
+            _pool_key = key
+
+    return _pool
+
+def preload_worker(modules_names):
+    # Import the simulator and the scheduler modules once for each worker
+    import_module("realsim.simulator")
+    for mod_name in modules_names:
+        import_module(mod_name)
+
+def submit_simulations(par_inp, executor) -> Simulation:
 
     # num, generator, gen_input, nodes, ppn, schedulers = par_inp
     generator_bundle, cluster_bundle, schedulers_bundle = par_inp
@@ -199,16 +233,13 @@ def parallel_simulations(par_inp):
     # Setup simulation
     sim = Simulation(jobs_set, lm.export_heatmap(),
                      nodes, socket_conf, queue_size,
-                     schedulers_bundle)
+                     schedulers_bundle, executor=executor)
     sim.set_default("Default Scheduler")
 
-    # Start simulation
+    # Submit the simulation of each scheduler to the pool of workers
     sim.run()
 
-    # Get results from simulation
-    res = sim.get_results()
-
-    return res
+    return sim
 
 @callback(
         Output("results-store", "data"),
@@ -270,31 +301,28 @@ def run_simulation(data, queue_size):
                 (sched_class, hyperparams)
         )
 
-    # Setup for parallel experiment execution
+    # Setup for parallel experiment execution; every pair of experiment and
+    # scheduler is a task of the same pool
     num_of_experiments = int(data["simulation-experiments"])
 
-    executor = ProcessPoolExecutor()
-    futures = list()
+    executor = worker_pool()
+    sims = list()
     for _ in range(num_of_experiments):
         par_inp = (generator_bundle, cluster_bundle, schedulers_bundle)
-        futures.append(
-                executor.submit(parallel_simulations, par_inp)
-        )
+        sims.append(submit_simulations(par_inp, executor))
 
     print("<----- EXPERIMENTS SUBMITTED ----->")
 
     start_time = time()
     
     # Wait till all the experiments finish
-    executor.shutdown(wait=True)
+    results = dict()
+    for idx, sim in enumerate(sims):
+        results[f"Experiment {idx}"] = sim.get_results()
     
     end_time = time()
     print("<----- EXECUTOR FINISHED ----->", timedelta(seconds=(end_time-start_time)))
 
-    results = dict()
-    for idx, future in enumerate(futures):
-        results[f"Experiment {idx}"] = future.result()
-
     return results, True
 
 clientside_callback(
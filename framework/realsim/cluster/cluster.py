@@ -2,18 +2,28 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
-from realsim.cluster.host import Host
-from realsim.jobs.jobs import Job
+from realsim.cluster.host import Host, BitmapHost, CoreBitmap
+from realsim.cluster.profile import AvailabilityProfile
+from realsim.jobs.jobs import Job, JobView
+from realsim.jobs.queue import JobQueue
+from bisect import insort, bisect_left
+from heapq import merge
+from itertools import islice
 from math import inf
+from typing import Iterator, Optional
+import numpy as np
 
 
 class Cluster:
 
-    def __init__(self, nodes: int, socket_conf: tuple):
+    def __init__(self, nodes: int, socket_conf: tuple, core_allocator: str = "procset"):
         """
         + nodes: the number of nodes
         + socket_conf: the socket configuration; for example (10, 16) means 2
         sockets of which the first has 10 cores and the second has 16 cores
+        + core_allocator: the backend keeping the free cores of the hosts;
+        "procset" for a processor set per socket or "bitmap" for a cluster
+        wide bit array
         """
 
         # Number of nodes
@@ -29,10 +39,36 @@ class Cluster:
 
         # Hosts where the hostname is a the string 'host' followed by a number
         _cores_per_node = sum(socket_conf)
-        self.hosts: dict[str, Host] = {
-                f"host{i}": Host(socket_conf, i * _cores_per_node + 1)
-                for i in range(nodes)
-        }
+        if core_allocator == "procset":
+            self.hosts: dict[str, Host] = {
+                    f"host{i}": Host(socket_conf, i * _cores_per_node + 1)
+                    for i in range(nodes)
+            }
+        elif core_allocator == "bitmap":
+            self.core_bitmap = CoreBitmap(nodes * _cores_per_node)
+            self.hosts: dict[str, Host] = {
+                    f"host{i}": BitmapHost(socket_conf, i * _cores_per_node + 1, self.core_bitmap)
+                    for i in range(nodes)
+            }
+        else:
+            raise RuntimeError(f"Core allocator of type {core_allocator} does not exist")
+
+        # Index of the free resources. Hosts are kept by their position in
+        # sorted lists; the idle hosts and the partially free hosts bucketed
+        # by the number of free cores per socket
+        self.host_names: list[str] = list(self.hosts.keys())
+        self.host_ids: dict[str, int] = {name: i for i, name in enumerate(self.host_names)}
+        self.idle_hosts: list[int] = list(range(nodes))
+        self.partial_hosts: dict[tuple, list[int]] = dict()
+        # The bucket of each host; None for the idle hosts
+        self.host_buckets: list[Optional[tuple]] = [None] * nodes
+
+        # Number of resident jobs of each load on each host; sized by the
+        # compute engine once the loads of the database are known
+        self.host_loads = np.zeros((nodes, 0), dtype=np.int32)
+
+        # Estimated releases of nodes by the executing jobs
+        self.profile = AvailabilityProfile()
 
         # Number of current free cores
         self.free_cores = self.nodes * _cores_per_node
@@ -46,9 +82,9 @@ class Cluster:
         # Waiting queue size
         self.queue_size = inf
         # The queue of waiting jobs
-        self.waiting_queue: list[Job] = list()
+        self.waiting_queue: JobQueue = JobQueue()
         # The list of executing jobs
-        self.execution_list: list[Job] = list()
+        self.execution_list: JobQueue = JobQueue()
 
         # Important counters #
 
@@ -60,7 +96,59 @@ class Cluster:
         self.makespan: float = 0
 
     def setup(self):
-        self.execution_list = list()
+        self.execution_list = JobQueue()
+
+    def waiting_snapshot(self, start: int = 0, stop: Optional[int] = None) -> tuple[JobView, ...]:
+        """Read-only views of the waiting queue from start up to stop. The
+        jobs are shared with the queue instead of copied; a scheduler changes
+        them only through allocation
+        """
+        return tuple(JobView(job) for job in islice(self.waiting_queue, start, stop))
+
+    def execution_snapshot(self) -> tuple[JobView, ...]:
+        """Read-only views of the execution list
+        """
+        return tuple(JobView(job) for job in self.execution_list)
+
+    def reindex_host(self, hostname: str) -> None:
+        """Move a host to the right bucket of the free resources index after
+        a job was deployed to or cleaned from it
+        """
+        host_id = self.host_ids[hostname]
+        host = self.hosts[hostname]
+
+        old_bucket = self.host_buckets[host_id]
+        if host.state == Host.IDLE:
+            new_bucket = None
+        else:
+            new_bucket = host.free_cores_per_socket()
+
+        if old_bucket == new_bucket:
+            return
+
+        # Remove from the old bucket
+        hosts = self.idle_hosts if old_bucket is None else self.partial_hosts[old_bucket]
+        del hosts[bisect_left(hosts, host_id)]
+        if old_bucket is not None and hosts == []:
+            del self.partial_hosts[old_bucket]
+
+        # Add to the new bucket
+        if new_bucket is None:
+            insort(self.idle_hosts, host_id)
+        else:
+            insort(self.partial_hosts.setdefault(new_bucket, list()), host_id)
+
+        self.host_buckets[host_id] = new_bucket
+
+    def suitable_hosts(self, socket_conf: tuple) -> Iterator[str]:
+        """Iterate in order over the hosts that are idle or have enough free
+        cores in each socket for a socket configuration
+        """
+        buckets = [hosts for free, hosts in self.partial_hosts.items()
+                   if all(cores <= free_cores for cores, free_cores in zip(socket_conf, free))]
+
+        for host_id in merge(self.idle_hosts, *buckets):
+            yield self.host_names[host_id]
 
     def get_idle_cores(self) -> int:
         return self.idle_cores
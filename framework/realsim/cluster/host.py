@@ -1,3 +1,4 @@
+import numpy as np
 from procset import ProcSet
 
 class Host:
@@ -8,9 +9,9 @@ class Host:
     DOWN = 2
 
     def __init__(self,
-                 socket_conf: tuple, 
+                 socket_conf: tuple,
                  first_core_id: int):
-        
+
         self.socket_conf = socket_conf
         self.sockets: list[ProcSet] = list()
 
@@ -23,9 +24,46 @@ class Host:
         # Set starting state of a host
         self.state = Host.IDLE
 
-        # Get references of the jobs running on the host
-        self.jobs: dict[str, list[ProcSet]] = dict()
- 
+        # The processor sets of the jobs running on the host by job id
+        self.jobs: dict[int, list[ProcSet]] = dict()
+
+    def first_free_cores(self, socket_conf: tuple) -> list[ProcSet]:
+        """Return the first free cores of each socket under a socket
+        configuration; socket_conf[i] cores from the i-th socket
+        """
+        psets: list[ProcSet] = list()
+        for cores, socket in zip(socket_conf, self.sockets):
+            intervals = list()
+            for interval in socket.intervals():
+                if cores <= 0:
+                    break
+                sup = min(interval.sup, interval.inf + cores - 1)
+                intervals.append((interval.inf, sup))
+                cores -= sup - interval.inf + 1
+            psets.append(ProcSet(*intervals))
+
+        return psets
+
+    def allocate(self, psets: list) -> None:
+        """Remove the cores of each socket from the free cores
+        """
+        for i, pset in enumerate(psets):
+            self.sockets[i] -= pset
+
+    def release(self, psets: list) -> None:
+        """Return the cores of each socket to the free cores
+        """
+        for i, pset in enumerate(psets):
+            self.sockets[i] = self.sockets[i].union(pset)
+
+    def to_procsets(self, psets: list) -> list[ProcSet]:
+        """The cores of each socket as processor sets for logging/reporting
+        """
+        return psets
+
+    def free_cores_per_socket(self) -> tuple:
+        return tuple(len(pset) for pset in self.sockets)
+
     def get_idle_cores_num(self) -> int:
         _sum = 0
         for pset in self.sockets:
@@ -37,5 +75,147 @@ class Host:
         return sum(self.socket_conf) * len(self.sockets) - self.get_idle_cores_num()
 
 
+def cores_to_procset(cores: np.ndarray) -> ProcSet:
+    """Convert a sorted array of core ids to a processor set
+    """
+    if len(cores) == 0:
+        return ProcSet()
+
+    # Positions where a run of consecutive cores breaks
+    breaks = np.flatnonzero(np.diff(cores) != 1)
+    infs = np.concatenate(([cores[0]], cores[breaks + 1]))
+    sups = np.concatenate((cores[breaks], [cores[-1]]))
+
+    return ProcSet(*zip(infs.tolist(), sups.tolist()))
+
+
+class CoreBitmap:
+    """Cluster wide bit array of the cores; the bit of a core is set if the
+    core is free. The bits are packed in little endian uint64 words.
+    """
+
+    def __init__(self, num_of_cores: int):
+        # Core ids start from 1
+        self.words = np.zeros(num_of_cores // 64 + 1, dtype="<u8")
+
+    def bits(self, first: int, last: int) -> np.ndarray:
+        """Unpacked bits of the cores first to last (inclusive)
+        """
+        first_word = first >> 6
+        unpacked = np.unpackbits(self.words[first_word:(last >> 6) + 1].view(np.uint8),
+                                 bitorder="little")
+        offset = first_word << 6
+        return unpacked[first - offset:last - offset + 1]
+
+    @staticmethod
+    def masks(cores: np.ndarray) -> np.ndarray:
+        return np.left_shift(np.uint64(1), (cores & 63).astype(np.uint64))
+
+    def set(self, cores: np.ndarray) -> None:
+        np.bitwise_or.at(self.words, cores >> 6, CoreBitmap.masks(cores))
+
+    def clear(self, cores: np.ndarray) -> None:
+        np.bitwise_and.at(self.words, cores >> 6, ~CoreBitmap.masks(cores))
+
+    def count(self, first: int, last: int) -> int:
+        """Popcount of the free cores first to last (inclusive)
+        """
+        return int(np.count_nonzero(self.bits(first, last)))
+
+    def first_free(self, first: int, last: int, k: int) -> np.ndarray:
+        """The first k free cores between first and last (inclusive); the set
+        bits are taken word by word, lowest first, until k are found
+        """
+        cores: list[int] = list()
+        first_word = first >> 6
+        last_word = last >> 6
+
+        for idx in range(first_word, last_word + 1):
+            word = int(self.words[idx])
+
+            # Drop the bits outside of the range of cores
+            if idx == first_word:
+                word &= ~((1 << (first & 63)) - 1)
+            if idx == last_word:
+                word &= (1 << ((last & 63) + 1)) - 1
+
+            while word and len(cores) < k:
+                # Isolate the lowest set bit; its position is the count of
+                # trailing zeros
+                lowest = word & -word
+                cores.append((idx << 6) + lowest.bit_length() - 1)
+                word ^= lowest
+
+            if len(cores) == k:
+                break
+
+        return np.array(cores, dtype=np.int64)
+
+
+class BitmapHost(Host):
+    """Host whose free cores live in a cluster wide CoreBitmap instead of a
+    processor set per socket. The cores of a job are kept as an array of
+    core ids per socket and are converted to processor sets only when they
+    are logged or reported.
+    """
+
+    def __init__(self,
+                 socket_conf: tuple,
+                 first_core_id: int,
+                 bitmap: CoreBitmap):
+
+        self.socket_conf = socket_conf
+        self.bitmap = bitmap
+
+        # First and last core id and number of free cores of each socket
+        self.socket_ranges: list[tuple[int, int]] = list()
+        self.free_counts: list[int] = list(socket_conf)
+
+        _count = first_core_id
+        for cores in socket_conf:
+            self.socket_ranges.append((_count, _count + cores - 1))
+            _count += cores
+
+        # All the cores of the host are free
+        self.bitmap.set(np.arange(first_core_id, _count, dtype=np.int64))
+
+        # Set starting state of a host
+        self.state = Host.IDLE
+
+        # The core ids of the jobs running on the host by job id
+        self.jobs: dict[int, list[np.ndarray]] = dict()
+
+    @property
+    def sockets(self) -> list[ProcSet]:
+        return [cores_to_procset(self.bitmap.first_free(first, last, last - first + 1))
+                for first, last in self.socket_ranges]
+
+    def first_free_cores(self, socket_conf: tuple) -> list[np.ndarray]:
+        return [self.bitmap.first_free(first, last, cores)
+                for cores, (first, last) in zip(socket_conf, self.socket_ranges)]
+
+    def allocate(self, psets: list) -> None:
+        for i, cores in enumerate(psets):
+            self.bitmap.clear(cores)
+            self.free_counts[i] -= len(cores)
+
+    def release(self, psets: list) -> None:
+        for i, cores in enumerate(psets):
+            self.bitmap.set(cores)
+            self.free_counts[i] += len(cores)
+
+    def to_procsets(self, psets: list) -> list[ProcSet]:
+        return [cores_to_procset(cores) for cores in psets]
+
+    def free_cores_per_socket(self) -> tuple:
+        return tuple(self.free_counts)
+
+    def get_idle_cores_num(self) -> int:
+        return sum(self.free_counts)
+
+    def get_used_cores_num(self) -> int:
+        return sum(self.socket_conf) - self.get_idle_cores_num()
+
+
 # Alias for Host class
 Node = Host
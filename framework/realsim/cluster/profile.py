@@ -0,0 +1,364 @@
+"""
+The availability profile is a time ordered step function of the nodes that
+the executing jobs are estimated to release. The estimation is based on the
+wall time of each job. The compute engine maintains the profile on every
+deploy and clean of a job and the backfilling schedulers query it instead of
+sorting copies of the execution list.
+
+The steps are kept in a treap keyed by time. Every step holds the nodes
+released up to its time; a subtree holds the minimum and maximum of its steps
+and an addition that is pending for its children. Inserting a step, adding to
+the steps of a time range and finding the first step above or the last step
+below a number of nodes take O(log n).
+"""
+
+import os
+import sys
+from math import inf
+from random import Random
+from typing import Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from realsim.jobs.jobs import Job
+
+
+class Step:
+
+    __slots__ = ("time", "released", "value", "priority", "left", "right", "low", "high", "lazy")
+
+    def __init__(self, time: float, value: int, priority: float):
+        self.time = time
+        # Nodes released exactly at the time of the step
+        self.released = 0
+        # Nodes released up to the time of the step minus the reservations
+        self.value = value
+        self.priority = priority
+        self.left: Optional[Step] = None
+        self.right: Optional[Step] = None
+        # Minimum and maximum value of the subtree
+        self.low = value
+        self.high = value
+        # Addition pending for the children
+        self.lazy = 0
+
+
+def apply(step: Optional[Step], delta: int) -> None:
+    if step is not None:
+        step.value += delta
+        step.low += delta
+        step.high += delta
+        step.lazy += delta
+
+def push(step: Step) -> None:
+    if step.lazy:
+        apply(step.left, step.lazy)
+        apply(step.right, step.lazy)
+        step.lazy = 0
+
+def update(step: Step) -> None:
+    low = high = step.value
+    for child in (step.left, step.right):
+        if child is not None:
+            if child.low < low:
+                low = child.low
+            if child.high > high:
+                high = child.high
+    step.low = low
+    step.high = high
+
+def split(step: Optional[Step], time: float) -> tuple:
+    """Split a treap into the steps before time and the rest
+    """
+    if step is None:
+        return None, None
+    push(step)
+    if step.time < time:
+        left, right = split(step.right, time)
+        step.right = left
+        update(step)
+        return step, right
+    else:
+        left, right = split(step.left, time)
+        step.left = right
+        update(step)
+        return left, step
+
+def merge(left: Optional[Step], right: Optional[Step]) -> Optional[Step]:
+    """Merge two treaps where all the steps of left precede those of right
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        push(left)
+        left.right = merge(left.right, right)
+        update(left)
+        return left
+    else:
+        push(right)
+        right.left = merge(left, right.left)
+        update(right)
+        return right
+
+def insert(step: Optional[Step], new: Step) -> Step:
+    if step is None:
+        return new
+    if new.priority > step.priority:
+        new.left, new.right = split(step, new.time)
+        update(new)
+        return new
+    push(step)
+    if new.time < step.time:
+        step.left = insert(step.left, new)
+    else:
+        step.right = insert(step.right, new)
+    update(step)
+    return step
+
+def delete(step: Optional[Step], time: float) -> Optional[Step]:
+    if step is None:
+        return None
+    push(step)
+    if step.time == time:
+        return merge(step.left, step.right)
+    if time < step.time:
+        step.left = delete(step.left, time)
+    else:
+        step.right = delete(step.right, time)
+    update(step)
+    return step
+
+def add_range(step: Optional[Step], start: float, end: float, delta: int,
+              low: float = -inf, high: float = inf) -> None:
+    """Add delta to the steps from start up to end; the times of the steps
+    of the subtree are between low and high
+    """
+    if step is None or high <= start or low >= end:
+        return
+    if start <= low and high <= end:
+        apply(step, delta)
+        return
+    push(step)
+    if start <= step.time < end:
+        step.value += delta
+    add_range(step.left, start, end, delta, low, step.time)
+    add_range(step.right, start, end, delta, step.time, high)
+    update(step)
+
+def first_at_least(step: Optional[Step], value: int,
+                   time: float = -inf, strict: bool = False) -> Optional[Step]:
+    """The first step from time (after time if strict) with at least value
+    """
+    if step is None or step.high < value:
+        return None
+    push(step)
+    if step.time < time or (strict and step.time == time):
+        return first_at_least(step.right, value, time, strict)
+    found = first_at_least(step.left, value, time, strict)
+    if found is not None:
+        return found
+    if step.value >= value:
+        return step
+    return first_at_least(step.right, value)
+
+def last_below(step: Optional[Step], value: int, start: float, end: float) -> Optional[Step]:
+    """The last step from start up to end with less than value
+    """
+    if step is None or step.low >= value:
+        return None
+    push(step)
+    if step.time >= end:
+        return last_below(step.left, value, start, end)
+    if step.time < start:
+        return last_below(step.right, value, start, end)
+    found = last_below(step.right, value, start, end)
+    if found is not None:
+        return found
+    if step.value < value:
+        return step
+    return last_below(step.left, value, start, end)
+
+
+class AvailabilityProfile:
+
+    def __init__(self):
+
+        # Steps at the estimated releases of the executing jobs and at the
+        # boundaries of the reservations of a backfilling pass
+        self.root: Optional[Step] = None
+        self.random = Random(0)
+
+        # Estimated release as (time, nodes) of each executing job by job id
+        self.jobs: dict[int, tuple[float, int]] = dict()
+
+        # State of a backfilling pass: its time, the idle nodes minus the
+        # nodes released by then, its reservations as (start, end, nodes) and
+        # the times of the steps it inserted. The releases that change during
+        # a pass are applied when it ends, so a pass sees the profile it
+        # started from
+        self.now: Optional[float] = None
+        self.offset = 0
+        self.reservations: list[tuple[float, float, int]] = list()
+        self.pass_times: set[float] = set()
+        self.pending: list[tuple[float, int]] = list()
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def value_at(self, time: float) -> int:
+        """Value of the step that time falls in; 0 before the first step
+        """
+        value = 0
+        step = self.root
+        while step is not None:
+            push(step)
+            if step.time <= time:
+                value = step.value
+                step = step.right
+            else:
+                step = step.left
+        return value
+
+    def find(self, time: float) -> Optional[Step]:
+        step = self.root
+        while step is not None and step.time != time:
+            push(step)
+            step = step.right if step.time < time else step.left
+        return step
+
+    def insert(self, time: float) -> Step:
+        """The step starting at time; a new step is inserted if time falls
+        inside another one
+        """
+        step = self.find(time)
+        if step is None:
+            step = Step(time, self.value_at(time), self.random.random())
+            self.root = insert(self.root, step)
+        return step
+
+    def change(self, time: float, nodes: int) -> None:
+        """Add nodes to (or remove from) the release at time
+        """
+        if self.now is not None:
+            self.pending.append((time, nodes))
+            return
+
+        step = self.insert(time)
+        step.released += nodes
+        add_range(self.root, time, inf, nodes)
+        if step.released == 0:
+            self.root = delete(self.root, time)
+
+    def end_pass(self) -> None:
+        """Cancel the reservations of the backfilling pass and apply the
+        releases that changed during it
+        """
+        if self.now is None:
+            return
+
+        for start, end, nodes in self.reservations:
+            add_range(self.root, start, end, nodes)
+        for time in self.pass_times:
+            if self.find(time).released == 0:
+                self.root = delete(self.root, time)
+
+        self.now = None
+        self.reservations.clear()
+        self.pass_times.clear()
+
+        pending = self.pending
+        self.pending = list()
+        for time, nodes in pending:
+            self.change(time, nodes)
+
+    def add(self, job: Job) -> None:
+        """Insert the estimated release of the nodes of a job that started
+        executing
+        """
+        release = (job.start_time + job.wall_time, len(job.assigned_hosts))
+        self.jobs[job.job_id] = release
+        self.change(*release)
+
+    def remove(self, job: Job) -> None:
+        """Remove the release of a job that finished executing
+        """
+        time, nodes = self.jobs.pop(job.job_id)
+        self.change(time, -nodes)
+
+    def released_by(self, time: float) -> int:
+        """Number of nodes estimated to be released up to time (inclusive)
+        """
+        self.end_pass()
+        return self.value_at(time)
+
+    def earliest_release(self, nodes: int) -> float:
+        """The earliest estimated time by which the released nodes sum up to
+        nodes; the first release if nodes is not positive and inf if the
+        executing jobs cannot release that many nodes
+        """
+        self.end_pass()
+        step = first_at_least(self.root, nodes)
+        return step.time if step is not None else inf
+
+    def start_pass(self, idle: int, now: float) -> None:
+        """Start a backfilling pass with the step function of the free nodes
+        from now on; at the current time only the idle nodes are free even if
+        some jobs exceeded their estimation
+        """
+        self.end_pass()
+        self.offset = idle - self.value_at(now)
+        self.now = now
+        self.split_pass(now)
+
+    def split_pass(self, time: float) -> None:
+        if time < inf:
+            self.insert(time)
+            self.pass_times.add(time)
+
+    def steps(self) -> list[tuple[float, int]]:
+        """The steps of the pass as (time, free nodes) in order of time
+        """
+        steps: list[tuple[float, int]] = list()
+
+        def walk(step: Optional[Step]) -> None:
+            if step is not None:
+                push(step)
+                walk(step.left)
+                if step.time >= self.now:
+                    steps.append((step.time, step.value + self.offset))
+                walk(step.right)
+
+        walk(self.root)
+        return steps
+
+    def reserve(self, start: float, duration: float, nodes: int) -> None:
+        """Reserve nodes for a waiting job from start for duration
+        """
+        end = start + duration
+        self.split_pass(start)
+        self.split_pass(end)
+        add_range(self.root, start, end, -nodes)
+        self.reservations.append((start, end, nodes))
+
+    def earliest_fit(self, nodes: int, duration: float, after: float = -inf) -> float:
+        """The earliest time after the time given that a job needing nodes
+        for duration can start without delaying any of the reservations; inf
+        if it never fits
+        """
+        needed = nodes - self.offset
+        time, strict = (self.now, False) if after < self.now else (after, True)
+
+        while True:
+            # The first step from which the nodes are free
+            step = first_at_least(self.root, needed, time, strict)
+            if step is None:
+                return inf
+
+            # The last step in the duration of the job that lacks nodes
+            blocking = last_below(self.root, needed, step.time, step.time + duration)
+            if blocking is None:
+                return step.time
+
+            time, strict = blocking.time, True
@@ -1,11 +1,11 @@
 # Utilities
 from math import inf, ceil
+from heapq import heappush, heappop
 import numpy as np
 
 # Simulation
 from procset import ProcSet
 from realsim.jobs.jobs import Job, JobCharacterization, JobState
-from realsim.jobs.utils import deepcopy_list
 from realsim.database import Database
 from realsim.cluster.host import Host
 from realsim.cluster.cluster import Cluster
@@ -13,6 +13,82 @@ from realsim.logger.logger import Logger
 import realsim.logger.logevts as evts
 
 
+class EventCalendar:
+    """Priority queue of the upcoming events of a simulation. Two kinds of
+    events are stored; the finish of an executing job and the arrival of a
+    preloaded job in the waiting queue. When the speedup of a job changes a
+    new finish event is pushed and the previous one is invalidated lazily.
+    """
+
+    # Event kinds
+    FINISH = 0
+    ARRIVAL = 1
+
+    def __init__(self):
+
+        # Heap of (time, token, kind, job) events
+        self.events: list[tuple] = list()
+
+        # Token of the valid finish event and absolute finish time of each
+        # executing job
+        self.tokens: dict[int, int] = dict()
+        self.finish_times: dict[int, float] = dict()
+
+        # Monotonic counter to break ties and tag the events
+        self.counter: int = 0
+
+    def push(self, time: float, kind: int, job: Job) -> int:
+        token = self.counter
+        heappush(self.events, (time, token, kind, job))
+        self.counter += 1
+        return token
+
+    def schedule_arrival(self, job: Job) -> None:
+        self.push(job.submit_time, EventCalendar.ARRIVAL, job)
+
+    def schedule_finish(self, job: Job, time: float) -> None:
+        """Schedule (or reschedule) the finish of an executing job at the
+        absolute time given; any previous finish event of the job is invalid
+        """
+        self.tokens[job.job_id] = self.push(time, EventCalendar.FINISH, job)
+        self.finish_times[job.job_id] = time
+
+    def cancel(self, job: Job) -> None:
+        self.tokens.pop(job.job_id, None)
+        self.finish_times.pop(job.job_id, None)
+
+    def remaining_time(self, job: Job, now: float) -> float:
+        return self.finish_times[job.job_id] - now
+
+    def is_valid(self, event: tuple, now: float) -> bool:
+        time, token, kind, job = event
+        if kind == EventCalendar.FINISH:
+            return self.tokens.get(job.job_id) == token
+        # Arrivals that are not in the future have already been handled
+        return time > now
+
+    def next_time(self, now: float) -> float:
+        """Return the time of the earliest valid event or inf if there is none
+        """
+        while self.events != [] and not self.is_valid(self.events[0], now):
+            heappop(self.events)
+
+        return self.events[0][0] if self.events != [] else inf
+
+    def pop_finished(self, now: float) -> list[Job]:
+        """Pop every event up to the time given and return the jobs that
+        finish their execution
+        """
+        finished: list[Job] = list()
+        while self.events != [] and self.events[0][0] <= now:
+            _, token, kind, job = heappop(self.events)
+            if kind == EventCalendar.FINISH and self.tokens.get(job.job_id) == token:
+                self.cancel(job)
+                finished.append(job)
+
+        return finished
+
+
 class ComputeEngine:
     
     def __init__(self, 
@@ -26,6 +102,20 @@ class ComputeEngine:
         self.scheduler = scheduler
         self.logger = logger
 
+        # Upcoming finish and arrival events
+        self.calendar = EventCalendar()
+
+        # Hosts where a job was deployed or cleaned since the last time step;
+        # only the jobs residing on them need their speedup recalculated
+        self.dirty_hosts: set[str] = set()
+
+        # Version of the state the scheduler works on; bumped only on changes
+        # that can let a failed scheduling pass succeed: a finish frees cores
+        # and an arrival brings a new job in reach of the scheduler. A pass
+        # that failed is not repeated until the version changes
+        self.state_version = 0
+        self.failed_version = -1
+
         self.scheduler.database = self.db
         self.scheduler.cluster = self.cluster
         self.scheduler.logger = self.logger
@@ -37,112 +127,134 @@ class ComputeEngine:
 
     # Database preloaded queue setup
     def setup_preloaded_jobs(self) -> None:
-        """Setup the preloaded jobs that are currently stored in the database
+        """Prepare the arrival of the preloaded jobs of the database; each
+        job is set up when it arrives in the waiting queue
         """
 
-        # Sort jobs by their time they will be appearing in the waiting queue
-        self.db.preloaded_queue.sort(key=lambda job: job.submit_time)
-
-        # Preload jobs and calculate their respective half and full node cores
-        # usage
-        for job in self.db.preloaded_queue:
-
-            # Set job id
-            job.job_id = self.cluster.id_counter
-
-            # Setup core resources needed
-            job.full_socket_nodes = ceil(job.num_of_processes / sum(self.cluster.full_socket_allocation))
-            job.half_socket_nodes = ceil(job.num_of_processes / sum(self.cluster.half_socket_allocation))
-
-            # Setup job speedups
-            speedups = list(self.db.heatmap[job.job_name].values())
-            speedups = [spd for spd in speedups if spd is not None]
-            max_speedup = min_speedup = speedups[0]
-            accumulator = length = 0
-            for speedup in speedups:
-                if speedup > max_speedup:
-                    max_speedup = speedup
-                if speedup < min_speedup:
-                    min_speedup = speedup
-
-                accumulator += speedup
-                length += 1
-
-            job.max_speedup = max_speedup
-            job.min_speedup = min_speedup
-            job.avg_speedup = (accumulator / length)
-
-            # Setup job characterization
-            avg = job.avg_speedup
-            std = round(float(np.std(speedups)), 2)
-
-            if avg > 1.02:
-                job.job_character = JobCharacterization.SPREAD
-            elif avg < 0.98:
-                job.job_character = JobCharacterization.COMPACT
+        # Summary of the loads residing in each host
+        self.cluster.host_loads = np.zeros((self.cluster.nodes, len(self.db.load_names)), dtype=np.int32)
+
+        self.schedule_next_arrival()
+
+    def schedule_next_arrival(self) -> None:
+        job = self.db.peek_arrival()
+        if job is not None:
+            self.calendar.schedule_arrival(job)
+
+    def setup_job(self, job: Job) -> None:
+        """Set up an arriving job; calculate its respective half and full node
+        cores usage, its speedups and characterization
+        """
+
+        # Set job id and register the job's load
+        job.job_id = self.cluster.id_counter
+        self.db.register_job(job)
+
+        # Loads missing from the heatmap are registered on their arrival
+        if job.load_id >= self.cluster.host_loads.shape[1]:
+            self.cluster.host_loads = np.pad(self.cluster.host_loads,
+                                             ((0, 0), (0, len(self.db.load_names) - self.cluster.host_loads.shape[1])))
+
+        # Setup core resources needed
+        job.full_socket_nodes = ceil(job.num_of_processes / sum(self.cluster.full_socket_allocation))
+        job.half_socket_nodes = ceil(job.num_of_processes / sum(self.cluster.half_socket_allocation))
+
+        # Setup job speedups from the precomputed statistics of its load
+        job.max_speedup = float(self.db.max_speedups[job.load_id])
+        job.min_speedup = float(self.db.min_speedups[job.load_id])
+        job.avg_speedup = float(self.db.avg_speedups[job.load_id])
+
+        # Setup job characterization
+        avg = job.avg_speedup
+        std = round(float(self.db.std_speedups[job.load_id]), 2)
+
+        if avg > 1.02:
+            job.job_character = JobCharacterization.SPREAD
+        elif avg < 0.98:
+            job.job_character = JobCharacterization.COMPACT
+        else:
+            if std > 0.07:
+                job.job_character = JobCharacterization.FRAIL
             else:
-                if std > 0.07:
-                    job.job_character = JobCharacterization.FRAIL
-                else:
-                    job.job_character = JobCharacterization.ROBUST
+                job.job_character = JobCharacterization.ROBUST
 
-            self.cluster.id_counter += 1
+        self.cluster.id_counter += 1
 
     def load_in_waiting_queue(self) -> None:
 
-        copy = deepcopy_list(self.db.preloaded_queue)
+        # Infinite waiting queue size; release every job submitted up to now
+        arrived = self.db.release_arrivals(self.cluster.makespan)
+        for job in arrived:
+            self.setup_job(job)
+            job.submit_time = self.cluster.makespan
+            self.logger.log(evts.JobArrival, job=job)
+            self.cluster.waiting_queue.append(job)
+            self.scheduler.waiting_queue_arrival(job)
+
+            # A failed pass of a scheduler that stops at the head of the
+            # queue is unaffected by jobs arriving behind the head
+            if (len(self.cluster.waiting_queue) == 1
+                    or not self.scheduler.head_only or self.scheduler.backfill_enabled):
+                self.state_version += 1
 
-        for job in copy:
-            if job.submit_time <= self.cluster.makespan:
-                # Infinite waiting queue size
-                # if self.cluster.queue_size == -1:
-                #     self.db.preloaded_queue.remove(job)
-                #     self.cluster.waiting_queue.append(job)
+        if arrived != []:
+            self.schedule_next_arrival()
+
+    # Job execution/deploying/cleaning computations
+    def get_remaining_time(self, job: Job) -> float:
+        """The remaining time of an executing job at the current makespan
+        """
+        return self.calendar.remaining_time(job, self.cluster.makespan)
 
-                # # Zero size waiting queue
-                # elif self.cluster.queue_size == 0 and\
-                #         len(self.cluster.waiting_queue) == 0 and\
-                #         self.scheduler.find_suitable_nodes(job.num_of_processes, self.cluster.full_socket_allocation) != {}:
-                #             self.db.preloaded_queue.remove(job)
-                #             job.submit_time = self.cluster.makespan
-                #             self.cluster.waiting_queue.append(job)
+    def schedule_job_finish(self, job: Job) -> None:
+        """Schedule the finish of a job that starts executing
+        """
+        self.calendar.schedule_finish(job, self.cluster.makespan + job.remaining_time)
 
-                # # Finite waiting queue size but not 0
-                # elif self.cluster.queue_size > 0 and len(self.cluster.waiting_queue) < self.cluster.queue_size:
-                self.db.preloaded_queue.remove(job)
-                job.submit_time = self.cluster.makespan
-                self.cluster.waiting_queue.append(job)
+    def update_job_speedup(self, job: Job, speedup: float) -> None:
+        """Change the speedup of an executing job, rescale its remaining time
+        and reschedule its finish event
+        """
+        job.remaining_time = self.get_remaining_time(job) * (job.sim_speedup / speedup)
+        job.sim_speedup = speedup
+        self.calendar.schedule_finish(job, self.cluster.makespan + job.remaining_time)
 
-                #else:
-                #    break
+    def pop_dirty_jobs(self) -> list[Job]:
+        """Return the executing jobs that share a host with a job that was
+        deployed or cleaned since the last time step
+        """
+        dirty_jobs: dict[int, Job] = dict()
+        for hostname in self.dirty_hosts:
+            for job_id in self.cluster.hosts[hostname].jobs.keys():
+                dirty_jobs[job_id] = self.cluster.execution_list.get(job_id)
+
+        self.dirty_hosts.clear()
+
+        return list(dirty_jobs.values())
 
-    # Job execution/deploying/cleaning computations
     def calculate_job_rem_time(self, job: Job) -> None:
 
         # The worst possible speedup
         worst_speedup = job.max_speedup
 
         # Important flags
-        neighbors_exist = False
         spread_allocation = not (job.socket_conf == self.cluster.socket_conf)
 
-        for hostname in job.assigned_hosts:
-            for co_job_signature in self.cluster.hosts[hostname].jobs.keys():
-
-                # Shouldn't check with ourselves
-                if job.get_signature() == co_job_signature:
-                    continue
+        # Loads of the co-jobs sharing a host with the job
+        co_load_ids = [self.db.job_load_ids[co_job_id]
+                       for hostname in job.assigned_hosts
+                       for co_job_id in self.cluster.hosts[hostname].jobs.keys()
+                       # Shouldn't check with ourselves
+                       if co_job_id != job.job_id]
 
-                neighbors_exist = True
+        neighbors_exist = co_load_ids != []
 
-                co_job_name = co_job_signature.split(":")[-1]
-                speedup = self.db.heatmap[job.job_name][co_job_name]
-                # If we do not have knowledge of the job's speedup when co-allocated
-                # to the specific co-job then use the average speedup
-                if speedup is None:
-                    speedup = job.avg_speedup
-                if speedup < worst_speedup:
-                    worst_speedup = speedup
+        if neighbors_exist:
+            speedups = self.db.speedups[job.load_id, co_load_ids]
+            # If we do not have knowledge of the job's speedup when co-allocated
+            # to the specific co-job then use the average speedup
+            speedups = np.where(np.isnan(speedups), job.avg_speedup, speedups)
+            worst_speedup = min(worst_speedup, float(speedups.min()))
 
         # Recalculate the remaining time of the job and the current speedup
 
@@ -152,40 +264,42 @@ class ComputeEngine:
             # Change only if the worst speedup is different from the current
             # speedup of the job
             if job.sim_speedup != worst_speedup:
-                job.remaining_time *= (job.sim_speedup / worst_speedup)
-                job.sim_speedup = worst_speedup
+                self.update_job_speedup(job, worst_speedup)
         # If no neighbors exist
         else:
             # If it is spread allocated check to change the rem time
             if spread_allocation:
                 # Change if it had neighbors but now it is executing alone
                 if job.sim_speedup != worst_speedup:
-                    job.remaining_time *= (job.sim_speedup / worst_speedup)
-                    job.sim_speedup = worst_speedup
+                    self.update_job_speedup(job, worst_speedup)
 
     def deploy_job_to_host(self, hostname: str, job: Job, psets: list[ProcSet]) -> None:
 
         # Store hostname in job's registry
         job.assigned_hosts.append(hostname)
+        self.dirty_hosts.add(hostname)
 
-        # Add job signature to the host and the processor set it allocates
+        # Add job id to the host and the processor set it allocates
         self.cluster.hosts[hostname].jobs.update({
-            job.get_signature(): psets
+            job.job_id: psets
         })
+        self.cluster.host_loads[self.cluster.host_ids[hostname], job.load_id] += 1
 
         # Remove psets from host and decrease the number of idle cores in cluster
-        for i, socket_pset in enumerate(self.cluster.hosts[hostname].sockets):
-            socket_pset -= psets[i]
-            self.cluster.idle_cores -= len(psets[i])
+        self.cluster.hosts[hostname].allocate(psets)
+        for pset in psets:
+            self.cluster.idle_cores -= len(pset)
 
         # Log the event
-        self.logger.log(evts.JobStart, msg=job.get_signature(), job=job, psets=psets, hostname=hostname)
-        self.logger.log(evts.JobDeployedToHost, msg=f"{job.get_signature()} in-> {hostname}")
+        self.logger.log(evts.JobStart, job=job,
+                        psets=self.cluster.hosts[hostname].to_procsets(psets), hostname=hostname)
+        self.logger.log(evts.JobDeployedToHost, job=job, hostname=hostname)
 
     def deploy_job_to_hosts(self, suitable_hosts, job) -> None:
 
         # Remove job from cluster's waiting queue
         self.cluster.waiting_queue.remove(job)
+        self.scheduler.waiting_queue_departure(job)
 
         job.current_state = JobState.EXECUTING
         job.start_time = self.cluster.makespan
@@ -195,9 +309,14 @@ class ComputeEngine:
             self.deploy_job_to_host(hostname, job, psets)
             # Set host state as allocated
             self.cluster.hosts[hostname].state = Host.ALLOCATED
+            self.cluster.reindex_host(hostname)
 
         # Add job to the executing list
         self.cluster.execution_list.append(job)
+        self.cluster.profile.add(job)
+
+        # Schedule the finish of the job
+        self.schedule_job_finish(job)
 
     def clean_job_from_hosts(self, job: Job) -> None:
 
@@ -208,94 +327,80 @@ class ComputeEngine:
         # Clean job and return resources back to host
         for hostname in job.assigned_hosts:
             # Log the event
-            self.logger.log(evts.JobCleanedFromHost, msg=f"{hostname} out-> {job.get_signature()}")
+            self.logger.log(evts.JobCleanedFromHost, job=job, hostname=hostname)
 
             # Return the allocated processors of a job to each host 
             # and add the number of returned cores to idle cores of cluster
-            for i, pset in enumerate(self.cluster.hosts[hostname].jobs[job.get_signature()]):
-                self.cluster.hosts[hostname].sockets[i] = self.cluster.hosts[hostname].sockets[i].union(pset)
+            psets = self.cluster.hosts[hostname].jobs[job.job_id]
+            self.cluster.hosts[hostname].release(psets)
+            for pset in psets:
                 self.cluster.idle_cores += len(pset)
+            self.cluster.host_loads[self.cluster.host_ids[hostname], job.load_id] -= 1
 
-            # Remove job signature from host
-            self.cluster.hosts[hostname].jobs.pop(job.get_signature())
+            # Remove job id from host
+            self.cluster.hosts[hostname].jobs.pop(job.job_id)
+            self.dirty_hosts.add(hostname)
             
             # Change state of host if nothing is executing
             if len(self.cluster.hosts[hostname].jobs.keys()) == 0:
                 self.cluster.hosts[hostname].state = Host.IDLE
+            self.cluster.reindex_host(hostname)
  
+        self.cluster.execution_list.remove(job)
+        self.cluster.profile.remove(job)
+        self.state_version += 1
+
         # Log the event
-        self.logger.log(evts.JobFinish, msg=f"{job.get_signature()}", job=job)
+        self.logger.log(evts.JobFinish, job=job)
 
 
     # Simulation loop computations
-    def goto_next_sim_state(self) -> None:
+    def next_time_step(self) -> float:
+        """The time until the next event; either the finish of an executing
+        job or the arrival of a preloaded job in the waiting queue
+        """
+        return self.calendar.next_time(self.cluster.makespan) - self.cluster.makespan
 
-        #NOTE: consider adding multithreading to
-        # 1) Job calculation for remaining time (reminder: the number of resources 
-        # also constrain the number of executing jobs, so it might not provide much)
-        # 2) Finding the minimum remaining execution time
-        # 3) Finding the minimum showup time in the preloaded queue (this is a more preferrable action
-        # at least in the beginning of a simulation)
+    def forward_time(self, time_step: float) -> list[Job]:
+        """Forward the makespan by time_step and return the jobs that finished
+        """
+        # Land on the time of the event itself instead of adding the time step
+        # so that rounding cannot separate simultaneous events
+        self.cluster.makespan = self.calendar.next_time(self.cluster.makespan)
+        return self.calendar.pop_finished(self.cluster.makespan)
 
-        # Recalculate the remaining time of jobs
-        for job in self.cluster.execution_list:
+    def goto_next_sim_state(self) -> None:
+
+        # Recalculate the remaining time of the jobs whose neighbourhood
+        # changed; a change of speedup reschedules the finish event of a job
+        for job in self.pop_dirty_jobs():
             self.calculate_job_rem_time(job)
 
-        # Find the minimum remaining execution time of the jobs currently executing
-        min_rem_time = inf
-        for job in self.cluster.execution_list:
-            if job.remaining_time < min_rem_time:
-                min_rem_time = job.remaining_time
-
-        # Find the minimum remaining time for a job to show up in the waiting
-        # queue of the cluster
-        for job in self.db.preloaded_queue:
-            showup_time = job.submit_time - self.cluster.makespan
-            if showup_time > 0 and showup_time < min_rem_time:
-                min_rem_time = showup_time
-        
+        # Find the time until the next event
+        min_rem_time = self.next_time_step()
+
         if min_rem_time <= 0:
             print("MIN_REM_TIME", min_rem_time)
         # Guard the execution
         assert min_rem_time > 0
 
-        if min_rem_time == inf and (self.cluster.waiting_queue != [] or self.db.preloaded_queue != []):
+        if min_rem_time == inf and (self.cluster.waiting_queue != [] or self.db.has_pending_arrivals()):
             print()
             print(self.cluster.get_idle_cores())
-            # print("PREL", self.db.preloaded_queue)
-            # print("WAIT", self.cluster.waiting_queue)
-            # print("EXEC", self.cluster.execution_list)
             print()
             raise RuntimeError
 
         # Forward the time of the execution
-        self.cluster.makespan += min_rem_time
+        finished = self.forward_time(min_rem_time)
 
         # Log the event
-        self.logger.log(evts.CompEngineNextTimeStep, msg=f"{min_rem_time}")
-
-        # "Execute" the jobs
-        execution_list: list[Job] = list()
-
-        # print("2) ", min_rem_time)
-
-        #INFO: consider multithreading the deletion of jobs
-        #WARN: pay attention to how the jobs are deleted from the host. 
-        # Dictionary access/deletion might not be thread safe
+        self.logger.log(evts.CompEngineNextTimeStep, time_step=min_rem_time)
 
         # Remove/clean any jobs that finished execution
-        for job in self.cluster.execution_list:
-
-            # "Execute" job
-            job.remaining_time -= min_rem_time
 
-            if job.remaining_time == 0:
-                self.clean_job_from_hosts(job)
-            else:
-                execution_list.append(job)
-
-        # Assign new execution list to cluster
-        self.cluster.execution_list = execution_list
+        for job in finished:
+            job.remaining_time = 0
+            self.clean_job_from_hosts(job)
 
     def sim_step(self) -> None:
 
@@ -305,8 +410,11 @@ class ComputeEngine:
         # Deploy to waiting queue any preloaded jobs that remain
         self.load_in_waiting_queue()
         
+        # Skip the scheduling pass if it already failed on the same state
+        unchanged = self.state_version == self.failed_version and not self.scheduler.time_dependent
+
         # Check if there are any jobs left waiting
-        if self.cluster.waiting_queue != []:
+        if self.cluster.waiting_queue != [] and not unchanged:
 
             # Deploy/Submit jobs to the execution list
             deployed = self.scheduler.deploy()
@@ -321,8 +429,144 @@ class ComputeEngine:
         if deployed:
             return
 
+        self.failed_version = self.state_version
+
         # If the scheduler didn't deploy jobs then
         # 1. the cluster's execution list is full
         # 2. There are no jobs in the waiting queue but there are in the 
         #    queue preloaded
         self.goto_next_sim_state()
+
+
+class ExecutionState:
+    """Structure of arrays with the execution state of the executing jobs.
+    Each job occupies a dense slot; when a job leaves, the last job is moved
+    into its slot so that the arrays stay contiguous. The finish times are
+    absolute like the ones of the event calendar and the slots past the
+    executing jobs hold sentinels (inf finish time, nan speedup).
+    """
+
+    def __init__(self, capacity: int = 64):
+
+        self.finish_time = np.full(capacity, inf, dtype=np.float64)
+        self.sim_speedup = np.full(capacity, np.nan, dtype=np.float64)
+
+        # Order in which the finish times were set; it breaks the ties of
+        # simultaneous finishes the same way as the tokens of the calendar
+        self.stamp = np.full(capacity, -1, dtype=np.int64)
+        self.counter = 0
+
+        # The job of each occupied slot and the slot of each job id
+        self.jobs: list[Job] = list()
+        self.slots: dict[int, int] = dict()
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def grow(self) -> None:
+        capacity = 2 * len(self.finish_time)
+        for name, sentinel in [("finish_time", inf), ("sim_speedup", np.nan), ("stamp", -1)]:
+            array = getattr(self, name)
+            new_array = np.full(capacity, sentinel, dtype=array.dtype)
+            new_array[:len(array)] = array
+            setattr(self, name, new_array)
+
+    def set_finish(self, slot: int, finish_time: float) -> None:
+        self.finish_time[slot] = finish_time
+        self.stamp[slot] = self.counter
+        self.counter += 1
+
+    def add(self, job: Job, finish_time: float) -> int:
+        slot = len(self.jobs)
+        if slot == len(self.finish_time):
+            self.grow()
+
+        self.set_finish(slot, finish_time)
+        self.sim_speedup[slot] = job.sim_speedup
+
+        self.jobs.append(job)
+        self.slots[job.job_id] = slot
+
+        return slot
+
+    def remove(self, job: Job) -> None:
+        slot = self.slots.pop(job.job_id)
+        last = len(self.jobs) - 1
+        last_job = self.jobs.pop()
+
+        # Move the last job in the freed slot
+        if slot != last:
+            self.finish_time[slot] = self.finish_time[last]
+            self.sim_speedup[slot] = self.sim_speedup[last]
+            self.stamp[slot] = self.stamp[last]
+            self.jobs[slot] = last_job
+            self.slots[last_job.job_id] = slot
+
+        self.finish_time[last] = inf
+        self.sim_speedup[last] = np.nan
+        self.stamp[last] = -1
+
+    def finished(self, now: float) -> list[Job]:
+        """The jobs that finish up to now in the order of their finish times
+        """
+        size = len(self.jobs)
+        slots = np.flatnonzero(self.finish_time[:size] <= now)
+        slots = slots[np.lexsort((self.stamp[slots], self.finish_time[slots]))]
+        return [self.jobs[slot] for slot in slots]
+
+
+class VectorComputeEngine(ComputeEngine):
+    """Compute engine that keeps the execution state of the executing jobs in
+    contiguous NumPy arrays. Finding the next time step, forwarding the time
+    and detecting the finished jobs are vectorized operations. The jobs of
+    the execution list remain the interface of the schedulers; their speedup
+    is kept in sync and their remaining time is given by get_remaining_time.
+    Only arrival events are kept in the calendar.
+    """
+
+    def __init__(self,
+                 db: Database,
+                 cluster: Cluster,
+                 scheduler,
+                 logger: Logger):
+        ComputeEngine.__init__(self, db, cluster, scheduler, logger)
+        self.state = ExecutionState()
+
+    def get_remaining_time(self, job: Job) -> float:
+        return float(self.state.finish_time[self.state.slots[job.job_id]]) - self.cluster.makespan
+
+    def schedule_job_finish(self, job: Job) -> None:
+        self.state.add(job, self.cluster.makespan + job.remaining_time)
+
+    def update_job_speedup(self, job: Job, speedup: float) -> None:
+        slot = self.state.slots[job.job_id]
+        job.remaining_time = self.get_remaining_time(job) * (float(self.state.sim_speedup[slot]) / speedup)
+        job.sim_speedup = speedup
+        self.state.sim_speedup[slot] = speedup
+        self.state.set_finish(slot, self.cluster.makespan + job.remaining_time)
+
+    def next_time(self) -> float:
+        """The time of the next event; arrivals are the only events of the
+        calendar
+        """
+        next_time = self.calendar.next_time(self.cluster.makespan)
+
+        if len(self.state) > 0:
+            next_time = min(next_time, float(self.state.finish_time[:len(self.state)].min()))
+
+        return next_time
+
+    def next_time_step(self) -> float:
+        return self.next_time() - self.cluster.makespan
+
+    def forward_time(self, time_step: float) -> list[Job]:
+
+        # Land on the time of the event itself as the default engine does
+        self.cluster.makespan = self.next_time()
+
+        finished = self.state.finished(self.cluster.makespan)
+
+        for job in finished:
+            self.state.remove(job)
+
+        return finished
@@ -13,7 +13,8 @@ the jobs will be addressed by their ids.
 
 import os
 import sys
-from typing import Optional, Protocol
+from typing import Callable, Iterable, Iterator, Optional, Protocol, Union
+import numpy as np
 
 # Set the root directory of the api library
 sys.path.append(os.path.abspath(os.path.join(
@@ -33,22 +34,95 @@ from realsim.jobs.utils import deepcopy_list
 
 Heatmap = dict[str,dict[str, Optional[float]]]
 
+# A jobs set or a factory that creates a fresh stream of jobs on every call
+JobsSource = Union[Iterable[Job], Callable[[], Iterable[Job]]]
+
 # Define the inference engine
 class InferenceEngine(Protocol):
     def predict(self, X):
         pass
 
 
+def replayable(jobs_set: JobsSource) -> JobsSource:
+    """A jobs source that can be given to many databases. A list or a factory
+    of streams is kept as is; a one-shot iterator (e.g. a generator) would be
+    consumed by the first database that pulls from it, so it is materialized
+    once into a list
+    """
+    if not callable(jobs_set) and iter(jobs_set) is jobs_set:
+        return list(jobs_set)
+    return jobs_set
+
+
 class Database:
 
     def __init__(self, 
-                 jobs_set: list[Job], 
+                 jobs_set: JobsSource, 
                  heatmap: Heatmap = dict(),
                  engine: Optional[InferenceEngine] = None):
-        self.preloaded_queue = deepcopy_list(jobs_set)
+
+        # The preloaded jobs are pulled lazily in the order of their submit
+        # time; lists are sorted here, any other iterable (e.g. a generator
+        # streaming a trace) must yield the jobs already sorted. A factory of
+        # streams is called when the database is set up
+        if isinstance(jobs_set, list):
+            jobs_set = sorted(jobs_set, key=lambda job: job.submit_time)
+        self.jobs_set: JobsSource = jobs_set
+        self.jobs_stream: Iterator[Job] = iter(())
+
+        # The next job to arrive; a copy so that a jobs set can be shared by
+        # many databases
+        self.next_job: Optional[Job] = None
+
         self.heatmap = heatmap
         self.engine = engine
 
+        # Integer ids of the loads (job names) and the heatmap compiled into a
+        # dense matrix indexed by them; NaN marks an unknown speedup
+        self.load_ids: dict[str, int] = dict()
+        self.load_names: list[str] = list()
+        self.speedups: np.ndarray = np.empty((0, 0))
+
+        # Statistics of the known speedups of each load (row of the matrix)
+        self.max_speedups: np.ndarray = np.empty(0)
+        self.min_speedups: np.ndarray = np.empty(0)
+        self.avg_speedups: np.ndarray = np.empty(0)
+        self.std_speedups: np.ndarray = np.empty(0)
+
+        # The load id of each job indexed by the job's handle (job id)
+        self.job_load_ids: list[int] = list()
+
+    def pull_arrival(self) -> None:
+        """Pull the next job to arrive from the jobs set; a ValueError is
+        raised if the jobs are not sorted by submit time
+        """
+        job = next(self.jobs_stream, None)
+        if job is not None and self.next_job is not None and job.submit_time < self.next_job.submit_time:
+            raise ValueError(f"The jobs are not sorted by submit time: job {job.job_name} "
+                             f"submitted at {job.submit_time} follows one submitted at "
+                             f"{self.next_job.submit_time}")
+        self.next_job = job.deepcopy() if job is not None else None
+
+    def has_pending_arrivals(self) -> bool:
+        """True if there are preloaded jobs that have not arrived yet
+        """
+        return self.next_job is not None
+
+    def peek_arrival(self) -> Optional[Job]:
+        """Return the next job to arrive without releasing it
+        """
+        return self.next_job
+
+    def release_arrivals(self, time: float) -> list[Job]:
+        """Release the preloaded jobs that were submitted up to the time given
+        """
+        released: list[Job] = list()
+        while self.next_job is not None and self.next_job.submit_time <= time:
+            released.append(self.next_job)
+            self.pull_arrival()
+
+        return released
+
     def pop(self, queue: list[Job]) -> Job:
         job: Job = queue[0]
         queue.remove(job)
@@ -60,12 +134,16 @@ class Database:
         # with values
         if self.engine is not None and self.heatmap == dict():
 
+            # The predictions need every job; materialize the jobs set
+            self.jobs_set = list(self.jobs_stream)
+            self.jobs_stream = iter(self.jobs_set)
+
             # Initialize the heatmap
-            for job in self.preloaded_queue:
+            for job in self.jobs_set:
                 self.heatmap[job.job_name] = {}
 
             # Get a copy of the preloaded queue
-            preloaded_queue = deepcopy_list(self.preloaded_queue)
+            preloaded_queue = deepcopy_list(self.jobs_set)
 
             while preloaded_queue != []:
 
@@ -92,5 +170,62 @@ class Database:
                             job.job_name: self.engine.predict(co_tag)
                     })
 
+    def init_load_ids(self):
+        """Assign an integer id to every load and compile the heatmap into a
+        dense speedup matrix indexed by them
+        """
+
+        for name, co_names in self.heatmap.items():
+            self.load_ids.setdefault(name, len(self.load_ids))
+            for co_name in co_names:
+                self.load_ids.setdefault(co_name, len(self.load_ids))
+
+        self.load_names = list(self.load_ids.keys())
+        self.speedups = np.full((len(self.load_names), len(self.load_names)), np.nan)
+        for name, co_names in self.heatmap.items():
+            for co_name, speedup in co_names.items():
+                if speedup is not None:
+                    self.speedups[self.load_ids[name], self.load_ids[co_name]] = speedup
+
+        # Per load statistics ignoring the unknown speedups; a load with no
+        # known speedup gets the statistics of a neutral speedup of 1.0
+        known = ~np.isnan(self.speedups)
+        count = np.count_nonzero(known, axis=1)
+        empty = count == 0
+        self.max_speedups = np.max(self.speedups, axis=1, initial=-np.inf, where=known)
+        self.min_speedups = np.min(self.speedups, axis=1, initial=np.inf, where=known)
+        self.avg_speedups = np.sum(self.speedups, axis=1, where=known) / np.maximum(count, 1)
+        deviations = np.where(known, self.speedups - self.avg_speedups[:, None], 0.0)
+        self.std_speedups = np.sqrt(np.sum(deviations ** 2, axis=1) / np.maximum(count, 1))
+        self.max_speedups[empty] = 1.0
+        self.min_speedups[empty] = 1.0
+        self.avg_speedups[empty] = 1.0
+        self.std_speedups[empty] = 0.0
+
+    def register_job(self, job: Job) -> None:
+        """Set the load id of a job and record it under the job's handle; the
+        handles are dense and given in order starting from 0
+        """
+        if job.job_name not in self.load_ids:
+            self.add_load(job.job_name)
+        job.load_id = self.load_ids[job.job_name]
+        self.job_load_ids.append(job.load_id)
+
+    def add_load(self, name: str) -> None:
+        """Register a load that is missing from the heatmap; all of its
+        speedups are unknown so its statistics are those of a neutral
+        speedup of 1.0
+        """
+        self.load_ids[name] = len(self.load_names)
+        self.load_names.append(name)
+        self.speedups = np.pad(self.speedups, ((0, 1), (0, 1)), constant_values=np.nan)
+        self.max_speedups = np.append(self.max_speedups, 1.0)
+        self.min_speedups = np.append(self.min_speedups, 1.0)
+        self.avg_speedups = np.append(self.avg_speedups, 1.0)
+        self.std_speedups = np.append(self.std_speedups, 0.0)
+
     def setup(self):
+        self.jobs_stream = iter(self.jobs_set() if callable(self.jobs_set) else self.jobs_set)
         self.init_heatmap()
+        self.init_load_ids()
+        self.pull_arrival()
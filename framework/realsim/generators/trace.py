@@ -0,0 +1,118 @@
+import os
+import sys
+import io
+import mmap
+from itertools import islice
+from typing import Iterator, Optional
+
+sys.path.append(os.path.abspath(
+    os.path.join(os.path.dirname(__name__), "..", "..")
+))
+
+from realsim.generators import *
+from realsim.generators.abstract import AbstractGenerator
+from realsim.jobs.swf import SWF_FIELDS
+
+
+def trace_lines(source: str, chunk_lines: int = 65536) -> Iterator[list[str]]:
+    """Yield chunks of the lines of a trace. The source is either the path of
+    a trace file, which is memory mapped, or the text of a trace.
+    """
+    if os.path.isfile(source):
+        with open(source, "rb") as fd:
+            if os.fstat(fd.fileno()).st_size == 0:
+                return
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = iter(mm.readline, b"")
+                while chunk := list(islice(lines, chunk_lines)):
+                    yield [line.decode("utf-8") for line in chunk]
+    else:
+        lines = io.StringIO(source)
+        while chunk := list(islice(lines, chunk_lines)):
+            yield chunk
+
+
+class TraceGenerator(AbstractGenerator[str]):
+
+    name = "Trace Generator"
+    description = "Replay the jobs of a trace in the Standard Workload Format or its CSV dialect"
+
+    def __init__(self, load_manager: LoadManager,
+                 executables: Optional[dict[str, str]] = None):
+        AbstractGenerator.__init__(self, load_manager=load_manager)
+
+        # Load names of the executable numbers of a real trace; the numbers
+        # of a real trace must all be mapped
+        self.executables = {str(number): name for number, name in (executables or dict()).items()}
+
+        # Precomputed lookup of the executable fields of a trace to the
+        # properties of the loads: name, processes, median time and tag
+        self.lookup: dict[str, tuple] = dict()
+        for name, load in self.load_manager:
+            self.lookup[name] = (load.load_name,
+                                 load.num_of_processes,
+                                 load.get_med_time(),
+                                 load.get_tag())
+
+    def load_of(self, executable: str) -> tuple:
+        """The load of the executable field of a trace; either the name of a
+        load or an executable number of a real trace mapped to a load by the
+        executables mapping. A KeyError is raised for any other name or
+        number
+        """
+        props = self.lookup.get(executable)
+        if props is None:
+            props = self.lookup[self.executables[executable]]
+            self.lookup[executable] = props
+        return props
+
+    def parse(self, line: str) -> Optional[Job]:
+        """Create a job from a line of a trace; None for comments, headers
+        and malformed lines. Only the job number, the submit time, the
+        requested time and the executable are read. The number of processes
+        and the run time are those of the load, because the speedups are
+        known per load; the requested and allocated processors and the run
+        time of the trace are ignored
+        """
+        if line.startswith(";") or line.startswith("Job Number"):
+            return None
+
+        fields = line.split(",") if "," in line else line.split()
+        if len(fields) < SWF_FIELDS:
+            return None
+
+        load_name, num_of_processes, med_time, tag = self.load_of(fields[13].strip())
+
+        # Unknown requested times are marked with -1 in real traces
+        wall_time = float(fields[8]) if fields[8].strip() else -1
+        if wall_time <= 0:
+            wall_time = 1.25 * med_time
+
+        job = Job(job_id=int(fields[0]),
+                  job_name=load_name,
+                  num_of_processes=num_of_processes,
+                  assigned_hosts=list(),
+                  remaining_time=med_time,
+                  submit_time=float(fields[1]),
+                  waiting_time=0,
+                  wall_time=wall_time)
+        job.job_tag = list(tag)
+
+        return job
+
+    def generate_jobs_stream(self, arg: str) -> Iterator[Job]:
+        """Lazily yield the jobs of a trace file or text in the order they
+        appear in the trace
+        """
+        for chunk in trace_lines(arg):
+            for line in chunk:
+                job = self.parse(line)
+                if job is not None:
+                    yield job
+
+    def generate_jobs_set(self, arg: str) -> list[Job]:
+        """Generate the jobs of a trace file or text
+
+        - arg: the path of the trace or its text
+        """
+        return list(self.generate_jobs_stream(arg))
@@ -1 +1,2 @@
-from .jobs import Job, JobCharacterization
+from .jobs import Job, JobView, JobCharacterization
+from .queue import JobQueue
@@ -39,9 +39,11 @@ class Job:
                  waiting_time, 
                  wall_time):
 
-        # Important identifiers of the job
+        # Important identifiers of the job; the job id is also the handle of
+        # the job in the hosts, the database and the logger
         self.job_id = job_id
         self.job_name = job_name
+        self.load_id: int = -1
 
         # Cores/Nodes resources
         self.num_of_processes = num_of_processes
@@ -122,6 +124,8 @@ class Job:
                    waiting_time=self.waiting_time,
                    wall_time=self.wall_time)
 
+        copy.load_id = self.load_id
+
         copy.full_socket_nodes = self.full_socket_nodes
         copy.half_socket_nodes = self.half_socket_nodes
         copy.socket_conf = self.socket_conf
@@ -143,3 +147,30 @@ class Job:
 
     def get_signature(self) -> str:
         return f"{self.job_id}:{self.job_name}"
+
+
+class JobView:
+    """Read-only view of a job that is handed to the schedulers; attributes
+    are read from the job and setting one raises an AttributeError. Only
+    Scheduler.allocation changes the job behind a view
+    """
+
+    __slots__ = ("_job",)
+
+    def __init__(self, job: Job):
+        object.__setattr__(self, "_job", job)
+
+    def __getattr__(self, name: str):
+        return getattr(self._job, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"Job {self._job.job_id} is read-only; it is changed only by its allocation")
+
+    def __repr__(self) -> str:
+        return repr(self._job)
+
+    @staticmethod
+    def unwrap(job) -> Job:
+        """The job behind a view or the job itself
+        """
+        return job._job if type(job) is JobView else job
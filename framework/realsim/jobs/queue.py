@@ -0,0 +1,65 @@
+"""
+Ordered collections of jobs indexed by their job id. The waiting queue and the
+execution list of a cluster keep the order of insertion like a list but find
+and remove a job by its id in constant time.
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from .jobs import Job
+
+
+class JobQueue:
+
+    def __init__(self, jobs: Iterable[Job] = ()):
+        # Python dictionaries keep the insertion order
+        self.jobs: dict[int, Job] = {job.job_id: job for job in jobs}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __bool__(self) -> bool:
+        return len(self.jobs) > 0
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(self.jobs.values())
+
+    def __contains__(self, job: Job) -> bool:
+        return job.job_id in self.jobs
+
+    def __getitem__(self, key):
+        """Positional access like a list; slices return a new list of jobs
+        """
+        if isinstance(key, slice):
+            if (key.start or 0) >= 0 and (key.stop is None or key.stop >= 0) and key.step is None:
+                return list(islice(self.jobs.values(), key.start, key.stop))
+            return list(self.jobs.values())[key]
+
+        if key == 0 and self.jobs:
+            return next(iter(self.jobs.values()))
+        return list(self.jobs.values())[key]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, JobQueue):
+            return list(self.jobs.values()) == list(other.jobs.values())
+        if isinstance(other, list):
+            # Cheap comparison against the empty list used as a condition
+            if other == []:
+                return not self.jobs
+            return list(self.jobs.values()) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"JobQueue({list(self.jobs.values())})"
+
+    def append(self, job: Job) -> None:
+        self.jobs[job.job_id] = job
+
+    def remove(self, job: Job) -> None:
+        """Remove a job by its id; the job can be a copy of the one stored
+        """
+        del self.jobs[job.job_id]
+
+    def get(self, job_id: int) -> Optional[Job]:
+        return self.jobs.get(job_id)
@@ -0,0 +1,16 @@
+"""
+The Standard Workload Format of job traces. The generators read traces in it
+and the Logger writes the workload of a simulation in its comma separated
+dialect.
+"""
+
+# Header of the comma separated dialect of the Standard Workload Format
+SWF_CSV_HEADER = ("Job Number,"
+                  "Submit Time,Wait Time,Run Time,"
+                  "Number of Allocated Processors,Average CPU Time Used,Used Memory,"
+                  "Requested Number of Processors,Requested Time,Requested Memory,"
+                  "Status,User ID,Group ID,Executable Number,"
+                  "Queue Number,Partition Number,Preceding Job Number,Think Time from Preceding Job\n")
+
+# Number of fields of a job in the Standard Workload Format
+SWF_FIELDS = 18
@@ -0,0 +1,212 @@
+"""
+Columnar store of the job events of a simulation. Every event is a row of
+preallocated typed columns: job id, event type, time, host id and the range of
+cores as first core and length. Logging an event is a few array writes and the
+per-job views of the Logger are derived from the columns on demand.
+"""
+
+from typing import Iterator, Optional
+
+import numpy as np
+from procset import ProcSet
+
+
+def interval_series(begins: np.ndarray, ends: np.ndarray, checkpoints: np.ndarray,
+                    weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """The sum of the weights of the intervals [begin, end) that contain each
+    checkpoint; a single sweep over the sorted begins and ends. Intervals
+    that end before they begin are ignored
+    """
+    keep = ends >= begins
+    begins = begins[keep]
+    ends = ends[keep]
+    weights = np.ones(len(begins), dtype=np.int64) if weights is None else weights[keep]
+
+    def passed(points: np.ndarray) -> np.ndarray:
+        order = np.argsort(points, kind="stable")
+        cumulative = np.concatenate(([0], np.cumsum(weights[order])))
+        return cumulative[np.searchsorted(points[order], checkpoints, side="right")]
+
+    return passed(begins) - passed(ends)
+
+
+class EventColumns:
+
+    # Event types
+    ARRIVAL = 0
+    START = 1
+    FINISH = 2
+
+    def __init__(self, capacity: int = 1024):
+
+        self.size = 0
+        self.job = np.empty(capacity, dtype=np.int64)
+        self.kind = np.empty(capacity, dtype=np.int8)
+        self.time = np.empty(capacity, dtype=np.float64)
+        self.host = np.empty(capacity, dtype=np.int32)
+        self.core_start = np.empty(capacity, dtype=np.int64)
+        self.core_len = np.empty(capacity, dtype=np.int64)
+
+        # Static properties of each job recorded at its arrival
+        self.job_names: dict[int, str] = dict()
+        self.job_procs: dict[int, int] = dict()
+        self.job_wall_times: dict[int, float] = dict()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.job)
+        for column in ["job", "kind", "time", "host", "core_start", "core_len"]:
+            old = getattr(self, column)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def append(self, job_id: int, kind: int, time: float,
+               host: int = -1, core_start: int = 0, core_len: int = 0) -> None:
+        if self.size == len(self.job):
+            self._grow()
+        row = self.size
+        self.job[row] = job_id
+        self.kind[row] = kind
+        self.time[row] = time
+        self.host[row] = host
+        self.core_start[row] = core_start
+        self.core_len[row] = core_len
+        self.size += 1
+
+    def arrival(self, job_id: int, time: float, job_name: str,
+                num_of_processes: int, wall_time: float) -> None:
+        self.job_names[job_id] = job_name
+        self.job_procs[job_id] = num_of_processes
+        self.job_wall_times[job_id] = wall_time
+        self.append(job_id, EventColumns.ARRIVAL, time)
+
+    def start(self, job_id: int, time: float, host: int, pset: ProcSet) -> None:
+        """One row for each contiguous range of cores of a job in a host
+        """
+        for interval in pset.intervals():
+            self.append(job_id, EventColumns.START, time, host,
+                        interval.inf, interval.sup - interval.inf + 1)
+
+    def finish(self, job_id: int, time: float) -> None:
+        self.append(job_id, EventColumns.FINISH, time)
+
+    def rows(self, kind: int) -> np.ndarray:
+        """Indices of the rows of an event type in logging order
+        """
+        return np.flatnonzero(self.kind[:self.size] == kind)
+
+    def job_times(self) -> tuple[np.ndarray, ...]:
+        """Arrays of the job ids in order of arrival and of their submit,
+        start and finish times and assigned cores; zero for the events that
+        did not happen
+        """
+        arrivals = self.rows(EventColumns.ARRIVAL)
+        job_ids = self.job[arrivals]
+        submit = self.time[arrivals]
+        start = np.zeros(len(arrivals))
+        finish = np.zeros(len(arrivals))
+        cores = np.zeros(len(arrivals), dtype=np.int64)
+
+        # Position of each job id in the order of arrival
+        order = np.argsort(job_ids)
+        def position(rows: np.ndarray) -> np.ndarray:
+            return order[np.searchsorted(job_ids[order], self.job[rows])]
+
+        starts = self.rows(EventColumns.START)
+        start[position(starts)] = self.time[starts]
+        np.add.at(cores, position(starts), self.core_len[starts])
+
+        finishes = self.rows(EventColumns.FINISH)
+        finish[position(finishes)] = self.time[finishes]
+
+        return job_ids, submit, start, finish, cores
+
+    def occupancy(self, checkpoints: list[float], num_of_cores: int) -> Iterator[np.ndarray]:
+        """Yield for each checkpoint the position in order of arrival of the
+        job executing on each core (-1 for an idle core). Only the starts and
+        finishes since the previous checkpoint are applied to the grid; the
+        same grid is yielded every time
+        """
+        job_ids, _, start, finish, _ = self.job_times()
+        order = np.argsort(job_ids)
+
+        # Intervals of cores of the jobs that executed for some time
+        rows = self.rows(EventColumns.START)
+        positions = order[np.searchsorted(job_ids[order], self.job[rows])]
+        executed = finish[positions] > start[positions]
+        rows = rows[executed]
+        positions = positions[executed]
+        firsts = self.core_start[rows] - 1
+        lasts = firsts + self.core_len[rows]
+
+        ons = np.argsort(start[positions], kind="stable")
+        offs = np.argsort(finish[positions], kind="stable")
+        on_times = start[positions][ons]
+        off_times = finish[positions][offs]
+
+        grid = np.full(num_of_cores, -1, dtype=np.int64)
+        next_on = 0
+        next_off = 0
+        for check in checkpoints:
+            last_on = np.searchsorted(on_times, check, side="right")
+            for idx in ons[next_on:last_on]:
+                grid[firsts[idx]:lasts[idx]] = positions[idx]
+            next_on = last_on
+
+            # Clear only the cores that were not taken by a later job
+            last_off = np.searchsorted(off_times, check, side="right")
+            for idx in offs[next_off:last_off]:
+                cores = grid[firsts[idx]:lasts[idx]]
+                cores[cores == positions[idx]] = -1
+            next_off = last_off
+
+            yield grid
+
+    def job_views(self, host_names: list[str]) -> dict[int, dict]:
+        """Per-job view of the events in order of arrival
+        """
+        views: dict[int, dict] = dict()
+
+        for row in self.rows(EventColumns.ARRIVAL):
+            job_id = int(self.job[row])
+            views[job_id] = {
+                    "job name": self.job_names[job_id],
+                    "trace": [], # [co-job, start time, end time]
+                    "speedups": [], # [sp1, sp2, ..]
+                    "cores": dict(), # {cojob1: cores1, cojob2: cores2, ..}
+                    "assigned procs": ProcSet(),
+                    "hosts": set(),
+                    "remaining time": [],
+                    "start time": 0,
+                    "finish time": 0,
+                    "submit time": 0,
+                    "waiting time": 0,
+                    "wall time": self.job_wall_times[job_id],
+                    "num of processes": self.job_procs[job_id],
+                    "arrival": float(self.time[row])
+            }
+
+        intervals: dict[int, list] = dict()
+        for row in self.rows(EventColumns.START):
+            job_id = int(self.job[row])
+            view = views[job_id]
+            view["submit time"] = view["arrival"]
+            view["start time"] = float(self.time[row])
+            view["waiting time"] = view["start time"] - view["submit time"]
+            view["hosts"].add(host_names[self.host[row]])
+            first = int(self.core_start[row])
+            intervals.setdefault(job_id, []).append((first, first + int(self.core_len[row]) - 1))
+
+        for job_id, job_intervals in intervals.items():
+            views[job_id]["assigned procs"] = ProcSet(*job_intervals)
+
+        for row in self.rows(EventColumns.FINISH):
+            views[int(self.job[row])]["finish time"] = float(self.time[row])
+
+        for view in views.values():
+            del view["arrival"]
+
+        return views
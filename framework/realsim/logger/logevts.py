@@ -1,9 +1,26 @@
+import logging
 from datetime import timedelta
 from abc import ABC, abstractmethod
 
 class LogEvent:
 
     hook = ""
+    level = logging.DEBUG
+
+    @staticmethod
+    def fields(**kwargs) -> tuple:
+        """The scalar fields of the details of the event taken from the
+        arguments it was logged with; kept instead of the arguments so that
+        the log shows the state at the time of the event
+        """
+        return (kwargs.get("msg", ""),)
+
+    @staticmethod
+    def extra(*fields) -> str:
+        """The details of the event from its fields; only called when the
+        log is rendered
+        """
+        return fields[0]
 
     @staticmethod
     def _log(msg: str, sec: float) -> str:
@@ -16,14 +33,41 @@ class LogEvent:
 
 
 
+class JobArrival(LogEvent):
+    hook = "job_logs"
+    level = logging.INFO
+    @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["job"].job_id, kwargs["job"].job_name)
+    @staticmethod
+    def extra(job_id, job_name) -> str:
+        return f"{job_id}:{job_name}"
+    @staticmethod
+    def log(extra: str, sec: float) -> str:
+        return LogEvent._log(f"Job arrived in the waiting queue [{extra}]", sec)
+
 class JobStart(LogEvent):
     hook = "job_logs"
+    level = logging.INFO
+    @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["job"].job_id, kwargs["job"].job_name)
+    @staticmethod
+    def extra(job_id, job_name) -> str:
+        return f"{job_id}:{job_name}"
     @staticmethod
     def log(extra: str, sec: float) -> str:
         return LogEvent._log(f"Job started executing [{extra}]", sec)
 
 class JobFinish(LogEvent):
     hook = "job_logs"
+    level = logging.INFO
+    @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["job"].job_id, kwargs["job"].job_name)
+    @staticmethod
+    def extra(job_id, job_name) -> str:
+        return f"{job_id}:{job_name}"
     @staticmethod
     def log(extra: str, sec: float) -> str:
         return LogEvent._log(f"Job finished execution [{extra}]", sec)
@@ -31,18 +75,36 @@ class JobFinish(LogEvent):
 class JobDeployedToHost(LogEvent):
     hook = "cluster_logs"
     @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["job"].job_id, kwargs["job"].job_name, kwargs["hostname"])
+    @staticmethod
+    def extra(job_id, job_name, hostname) -> str:
+        return f"{job_id}:{job_name} in-> {hostname}"
+    @staticmethod
     def log(extra: str, sec: float) -> str:
         return LogEvent._log(f"Job deployed to host [{extra}]", sec)
 
 class JobCleanedFromHost(LogEvent):
     hook = "cluster_logs"
     @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["job"].job_id, kwargs["job"].job_name, kwargs["hostname"])
+    @staticmethod
+    def extra(job_id, job_name, hostname) -> str:
+        return f"{hostname} out-> {job_id}:{job_name}"
+    @staticmethod
     def log(extra: str, sec: float) -> str:
         return LogEvent._log(f"Job cleaned from host [{extra}]", sec)
 
 class CompEngineNextTimeStep(LogEvent):
     hook = "compeng_logs"
     @staticmethod
+    def fields(**kwargs) -> tuple:
+        return (kwargs["time_step"],)
+    @staticmethod
+    def extra(time_step) -> str:
+        return f"{time_step}"
+    @staticmethod
     def log(extra: str, sec: float) -> str:
         return LogEvent._log(f"Calculated the simulation time step [{extra}]", sec)
 
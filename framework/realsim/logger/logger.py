@@ -1,7 +1,9 @@
 import os
 import sys
+import logging
+from collections import deque
 from functools import reduce
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from datetime import timedelta
 
 sys.path.append(os.path.abspath(
@@ -16,10 +18,16 @@ sys.path.append(os.path.abspath(
 from realsim.jobs.jobs import Job
 from realsim.database import Database
 from realsim.cluster.cluster import Cluster
+from realsim.jobs.swf import SWF_CSV_HEADER
 import realsim.logger.logevts as evts
+from realsim.logger.columns import EventColumns, interval_series
+from realsim.logger.metrics import OnlineMetrics
+from realsim.logger.summary import JobsSummary
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express.colors as colors
 from procset import ProcSet
+import numpy as np
 
 if TYPE_CHECKING:
     from realsim.scheduler.scheduler import Scheduler
@@ -31,9 +39,14 @@ class Logger(object):
     for later use
     """
 
-    def __init__(self, debug=True):
+    def __init__(self, debug=True, retain=True, sinks: Optional[list] = None,
+                 level: int = logging.DEBUG, capacity: int = 100000):
         # Controls if 
         self.debug = debug
+        # Controls if the events of the jobs are retained for the get_*
+        # methods; the metrics sinks receive the events in any case
+        self.retain = retain
+        self.sinks: list[OnlineMetrics] = sinks if sinks is not None else list()
 
         self.database: Database
         self.cluster: Cluster
@@ -41,34 +54,71 @@ class Logger(object):
 
         self.scale = colors.sequential.Turbo
 
-        self.compeng_logs: list[str] = list()
-        self.job_logs: list[str] = list()
-        self.db_logs: list[str] = list()
-        self.cluster_logs: list[str] = list()
-        self.scheduler_logs: list[str] = list()
+        # Debug records as (event, time, fields) of the events at or above
+        # level; the fields are scalars taken when the event is logged. Only
+        # the latest records up to capacity are kept and they are rendered to
+        # text when the logs are read
+        self.level = level
+        self.records: deque[tuple] = deque(maxlen=capacity)
+
+    def get_logs(self, hook: Optional[str] = None) -> list[str]:
+        """The rendered debug logs; all of them or the ones of a hook
+        """
+        return [evt.log(evt.extra(*fields), sec)
+                for evt, sec, fields in self.records
+                if hook is None or evt.hook == hook]
+
+    def dump_logs(self, path: str) -> None:
+        with open(path, "w") as fd:
+            for line in self.get_logs():
+                fd.write(line + "\n")
+
+    @property
+    def compeng_logs(self) -> list[str]:
+        return self.get_logs("compeng_logs")
+
+    @property
+    def job_logs(self) -> list[str]:
+        return self.get_logs("job_logs")
+
+    @property
+    def db_logs(self) -> list[str]:
+        return self.get_logs("db_logs")
+
+    @property
+    def cluster_logs(self) -> list[str]:
+        return self.get_logs("cluster_logs")
+
+    @property
+    def scheduler_logs(self) -> list[str]:
+        return self.get_logs("scheduler_logs")
 
     def log(self, evt: type[evts.LogEvent], **kwargs) -> None:
 
-        if self.debug:
-            try:
-                self.__dict__[evt.hook].append(evt.log(kwargs["msg"], self.cluster.makespan))
-            except:
-                raise RuntimeError(f"The log event specified ({evt}) doesn't exist")
+        if self.debug and evt.level >= self.level:
+            self.records.append((evt, self.cluster.makespan, evt.fields(**kwargs)))
+
+        for sink in self.sinks:
+            sink.log(evt, **kwargs)
+
+        if not self.retain:
+            return
+
+        if evt == evts.JobArrival:
+            job: Job = kwargs["job"]
+            self.events.arrival(job.job_id, job.submit_time, job.job_name,
+                                job.num_of_processes, job.wall_time)
 
         if evt == evts.JobStart:
             job: Job = kwargs["job"]
             psets: list[ProcSet] = kwargs["psets"]
             pset = reduce(lambda pA, pB: pA.union(pB), psets)
-            hostname: str = kwargs["hostname"]
-            self.job_events[job.get_signature()]["submit time"] = job.submit_time
-            self.job_events[job.get_signature()]["start time"] = job.start_time
-            self.job_events[job.get_signature()]["waiting time"] = job.start_time - job.submit_time
-            self.job_events[job.get_signature()]["assigned procs"] = self.job_events[job.get_signature()]["assigned procs"].union(pset)
-            self.job_events[job.get_signature()]["hosts"].add(hostname)
+            self.events.start(job.job_id, job.start_time,
+                              self.cluster.host_ids[kwargs["hostname"]], pset)
 
         if evt == evts.JobFinish:
             job: Job = kwargs["job"]
-            self.job_events[job.get_signature()]["finish time"] = job.finish_time
+            self.events.finish(job.job_id, job.finish_time)
 
         # When a log is submitted update also the values
         if evt == evts.JobStart or evt == evts.JobFinish:
@@ -85,6 +135,9 @@ class Logger(object):
 
     def setup(self):
 
+        for sink in self.sinks:
+            sink.setup(self.cluster)
+
         # Cluster wide events
         self.cluster_events = dict()
         # self.cluster_events["checkpoints"] = set()
@@ -100,38 +153,32 @@ class Logger(object):
         self.cluster_events["finished jobs"] = [0]
 
         # Events #
-        # Job events
-        self.job_events: dict[str, dict] = dict()
-
-        # Init job events
-        for job in self.database.preloaded_queue:
-            # Job events
-            jevts = {
-                    "trace": [], # [co-job, start time, end time]
-                    "speedups": [], # [sp1, sp2, ..]
-                    "cores": dict(), # {cojob1: cores1, cojob2: cores2, ..}
-                    "assigned procs": ProcSet(),
-                    "hosts": set(),
-                    "remaining time": [],
-                    "start time": 0,
-                    "finish time": 0,
-                    "submit time": 0,
-                    "waiting time": 0,
-                    "wall time": job.wall_time,
-                    "num of processes": job.num_of_processes
-            }
-            self.job_events[job.get_signature()] = jevts
-
-    def get_gantt_representation(self):
+        # Job events in columns; the per-job view is derived on demand
+        self.events = EventColumns()
+        self._job_events: dict[int, dict] = dict()
+        self._job_events_size = 0
+
+    @property
+    def job_events(self) -> dict[int, dict]:
+        """The events of each job by job id in order of arrival
+        """
+        if self._job_events_size != len(self.events):
+            self._job_events = self.events.job_views(self.cluster.host_names)
+            self._job_events_size = len(self.events)
+        return self._job_events
+
+    def _gantt_data(self) -> list:
+        """One filled trace for each interval of cores of each job
+        """
 
         # Create the color palette for each job
         num_of_jobs = len(self.job_events.keys())
         jcolors = colors.sample_colorscale(self.scale, [n/(num_of_jobs - 1) for n in range(num_of_jobs)])
 
-        # Create data for figure
         fig_data = list()
+        for idx, [job_id, jevt] in enumerate(self.job_events.items()):
 
-        for idx, [key, jevt] in enumerate(self.job_events.items()):
+            key = f"{job_id}:{jevt['job name']}"
 
             for interval in jevt["assigned procs"].intervals():
                 x_min = jevt["start time"]
@@ -160,6 +207,87 @@ class Logger(object):
                     f"processors = {len(jevt['assigned procs'])}",
                 ))
 
+        return fig_data
+
+    def _compact_gantt_data(self, buckets: int, pixels: Optional[int]) -> list:
+        """One filled trace per colour bucket; the rectangles of the jobs are
+        polygons separated by gaps. With the height of the plot in pixels the
+        intervals of cores of a job that are less than a pixel high are not
+        drawn; a job keeps at least its first interval
+        """
+        num_of_jobs = len(self.job_events.keys())
+        buckets = max(1, min(buckets, num_of_jobs))
+        bcolors = colors.sample_colorscale(self.scale, [b/max(buckets - 1, 1) for b in range(buckets)])
+        min_height = self.cluster.total_cores / pixels if pixels else 0
+
+        xs: list[list] = [list() for _ in range(buckets)]
+        ys: list[list] = [list() for _ in range(buckets)]
+
+        # A hover point in the middle of the first rectangle of each job
+        hover_xs, hover_ys, hover_names, hover_data = list(), list(), list(), list()
+
+        for idx, [job_id, jevt] in enumerate(self.job_events.items()):
+
+            bucket = idx * buckets // num_of_jobs
+            x_min = jevt["start time"]
+            x_max = jevt["finish time"]
+
+            intervals = [(interval.inf, interval.sup) for interval in jevt["assigned procs"].intervals()]
+            intervals = [(y_min, y_max) for y_min, y_max in intervals
+                         if y_max - y_min + 1 >= min_height] or intervals[:1]
+
+            for y_min, y_max in intervals:
+                xs[bucket].extend([x_min, x_max, x_max, x_min, x_min, None])
+                ys[bucket].extend([y_min, y_min, y_max, y_max, y_min, None])
+
+            if intervals:
+                hover_xs.append((x_min + x_max) / 2)
+                hover_ys.append((intervals[0][0] + intervals[0][1]) / 2)
+                hover_names.append(jevt["job name"])
+                hover_data.append([job_id, jevt["submit time"], jevt["start time"],
+                                   jevt["finish time"], jevt["waiting time"],
+                                   len(jevt["hosts"]), len(jevt["assigned procs"])])
+
+        fig_data = [go.Scatter(x=xs[bucket],
+                               y=ys[bucket],
+                               mode="lines",
+                               line=dict(width=0.1, color="black"),
+                               fill="toself",
+                               fillcolor=bcolors[bucket],
+                               showlegend=False,
+                               hoverinfo="skip")
+                    for bucket in range(buckets) if xs[bucket]]
+
+        fig_data.append(go.Scatter(x=hover_xs,
+                                   y=hover_ys,
+                                   mode="markers",
+                                   marker=dict(size=6, opacity=0),
+                                   showlegend=False,
+                                   text=hover_names,
+                                   customdata=hover_data,
+                                   hovertemplate="<b>%{customdata[0]}:%{text}</b><br>"+
+                                   "submit time = %{customdata[1]:.2f} s<br>"+
+                                   "start time = %{customdata[2]:.2f} s<br>"+
+                                   "finish time = %{customdata[3]:.2f} s<br>"+
+                                   "waiting time = %{customdata[4]:.2f} s<br>"+
+                                   "hosts = %{customdata[5]}<br>"+
+                                   "processors = %{customdata[6]}<extra></extra>"))
+
+        return fig_data
+
+    def get_gantt_representation(self, compact: bool = False, buckets: int = 16,
+                                 pixels: Optional[int] = None):
+        """Gantt plot of the cores allocated to each job. The default mode
+        creates a trace for every interval of cores of each job; the compact
+        mode packs the jobs in a few traces, one per colour bucket
+        """
+
+        # Create data for figure
+        if compact:
+            fig_data = self._compact_gantt_data(buckets, pixels)
+        else:
+            fig_data = self._gantt_data()
+
         xaxis_tickvals = [i * (self.cluster.makespan / 10) for i in range(0, 11)]
         xaxis_ticktext = [str(timedelta(seconds=i)).split('.')[0] for i in xaxis_tickvals]
 
@@ -183,44 +311,66 @@ class Logger(object):
         )
         return fig.to_json()
 
+    def get_jobs_summary(self) -> JobsSummary:
+        """Compact summary of the times of the jobs to compare other
+        simulations against this one
+        """
+        job_ids, submit, start, finish, _ = self.events.job_times()
+        job_names = [self.events.job_names[job_id] for job_id in job_ids.tolist()]
+        return JobsSummary(self.cluster.makespan, job_ids, job_names, submit, start, finish)
+
     def get_jobs_utilization(self, logger):
         """Get different utilization metrics for each job in comparison to
-        another (common use: default scheduling) logger
+        another (common use: default scheduling) logger or its summary
         """
 
-        if not isinstance(logger, Logger):
-            raise RuntimeError("Provide a Logger instance")
-
-        # Boxplot points
-        points = dict()
-
-        for job_sig in self.job_events:
-
-            # Utilization numbers
-            job_points = {
-                "speedup": (logger.job_events[job_sig]["finish time"] - logger.job_events[job_sig]["start time"]) / (self.job_events[job_sig]["finish time"] -self.job_events[job_sig]["start time"]),
-                "turnaround": (logger.job_events[job_sig]["finish time"] - logger.job_events[job_sig]["submit time"]) / (self.job_events[job_sig]["finish time"] -self.job_events[job_sig]["submit time"]),
-                "waiting": logger.job_events[job_sig]["waiting time"] - self.job_events[job_sig]["waiting time"]
-            }
-
-            points[job_sig] = job_points
+        if isinstance(logger, Logger):
+            other = logger.get_jobs_summary()
+        elif isinstance(logger, JobsSummary):
+            other = logger
+        else:
+            raise RuntimeError("Provide a Logger or a JobsSummary instance")
 
-        return points
+        return self.get_jobs_summary().utilization(other)
 
     def get_waiting_queue_graph(self):
-        num_of_jobs: list[int] = list()
-        for check in sorted(list(self.cluster_events["checkpoints"])):
-            jobs_in_check = 0
-            for _, jevt in self.job_events.items():
-                if jevt["submit time"] <= check and jevt["start time"] > check:
-                    jobs_in_check += 1
-            num_of_jobs.append(jobs_in_check)
+        """Number of jobs in the waiting queue at each checkpoint
+        """
+        checkpoints = sorted(list(self.cluster_events["checkpoints"]))
+        _, submit, start, _, _ = self.events.job_times()
+        return (
+                checkpoints,
+                interval_series(submit, start, np.array(checkpoints)).tolist()
+        )
 
+    def get_running_jobs_graph(self):
+        """Number of executing jobs at each checkpoint
+        """
+        checkpoints = sorted(list(self.cluster_events["checkpoints"]))
+        _, _, start, finish, _ = self.events.job_times()
         return (
-                sorted(list(self.cluster_events["checkpoints"])),
-                num_of_jobs
+                checkpoints,
+                interval_series(start, finish, np.array(checkpoints)).tolist()
         )
 
+    def get_allocated_cores_graph(self):
+        """Number of cores allocated to executing jobs at each checkpoint
+        """
+        checkpoints = sorted(list(self.cluster_events["checkpoints"]))
+        _, _, start, finish, cores = self.events.job_times()
+        return (
+                checkpoints,
+                interval_series(start, finish, np.array(checkpoints), cores).tolist()
+        )
+
+    def get_metrics(self) -> dict:
+        """Summary metrics of the attached metrics sinks
+        """
+        metrics = dict()
+        for sink in self.sinks:
+            metrics.update(sink.summary())
+        return metrics
+
     def get_jobs_throughput(self):
         return (
                 sorted(list(self.cluster_events["checkpoints"])),
@@ -238,27 +388,21 @@ class Logger(object):
         """Return 1-5 and 9 fields frm the Standart Workload Format
         """
 
-        header = "Job Number,"
-        header += "Submit Time,Wait Time,Run Time," # Actual times
-        header += "Number of Allocated Processors,Average CPU Time Used,Used Memory," # Used resources
-        header += "Requested Number of Processors,Requested Time,Requested Memory," # Requested resources
-        header += "Status,User ID,Group ID,Executable Number," # Assign job_name
-        header += "Queue Number,Partition Number,Preceding Job Number,Think Time from Preceding Job\n" # Irrelevant for us
-
-        workload = ""
-        for jevt_id, jevt in self.job_events.items():
-            job_id, job_name = jevt_id.split(':')
-            workload += f"{job_id},"
-            workload += f"{jevt['submit time']},{jevt['waiting time']},{jevt['finish time']-jevt['start time']},"
-            workload += f"{len(jevt['assigned procs'])},,,"
-            workload += f"{jevt['num of processes']},{jevt['wall time']},,"
-            workload += f"1,,,{job_name},"
-            workload += f",,,\n"
-
-        return header + workload
-
-    def get_animated_cluster(self):
-        """Animate the different jobs allocating cores in a cluster
+        # The job name is given as the executable number
+        workload = [SWF_CSV_HEADER]
+        for job_id, jevt in self.job_events.items():
+            workload.append(f"{job_id},"
+                            f"{jevt['submit time']},{jevt['waiting time']},{jevt['finish time']-jevt['start time']},"
+                            f"{len(jevt['assigned procs'])},,,"
+                            f"{jevt['num of processes']},{jevt['wall time']},,"
+                            f"1,,,{jevt['job name']},"
+                            f",,,\n")
+
+        return "".join(workload)
+
+    def get_animated_cluster(self, max_frames: Optional[int] = None):
+        """Animate the different jobs allocating cores in a cluster; at most
+        max_frames evenly spaced checkpoints are animated if given
         """
 
         hosts = list(sorted(self.cluster.hosts.keys(), key=lambda name: int(name.replace("host", ""))))
@@ -271,50 +415,26 @@ class Logger(object):
         num_of_jobs = len(self.job_events.keys())
         jcolors = colors.sample_colorscale(self.scale, [n/(num_of_jobs - 1) for n in range(num_of_jobs)])
 
+        checkpoints = sorted(list(self.cluster_events["checkpoints"]))
+        if max_frames is not None and len(checkpoints) > max_frames:
+            picks = np.unique(np.linspace(0, len(checkpoints) - 1, max_frames).round().astype(int))
+            checkpoints = [checkpoints[pick] for pick in picks]
+
+        # The job id and the label of each job in order of arrival; an idle
+        # core (-1) maps to the last entries
+        job_ids = np.append(np.array(list(self.job_events.keys()), dtype=np.int64), -100)
+        labels = np.array([f"{idx}:{jevt['job name']}" for idx, jevt in self.job_events.items()] + [""],
+                          dtype=object)
+
         frames = []
-        for check in sorted(list(self.cluster_events["checkpoints"])):
-
-            cluster_flat = [-100] * (num_of_hosts * ppn)
-            jobnames_flat = [""] * (num_of_hosts * ppn)
-
-            for idx, [key, jevt] in enumerate(self.job_events.items()):
-
-                if jevt["start time"] <= check and jevt["finish time"] > check:
-                    idx, name = key.split(":")
-                    assigned_procs = list(jevt["assigned procs"])
-                    for proc in assigned_procs:
-                        cluster_flat[proc-1] = int(idx)
-                        jobnames_flat[proc-1] = f"{idx}:{name}"
-
-            cluster = list()
-            host = list()
-            cluster_text = list()
-            host_text = list()
-            for i, val in enumerate(cluster_flat):
-                host.append(val)
-                host_text.append(jobnames_flat[i])
-                if (i+1) % ppn == 0:
-                    cluster.append(host)
-                    host = list()
-                    cluster_text.append(host_text)
-                    host_text = list()
-
-            frames.append(
-                    go.Frame(data=[
-                        go.Heatmap(
-                            z=cluster, 
-                            x=cores, 
-                            y=hosts, 
-                            xgap=3, 
-                            ygap=3, 
-                            colorscale=jcolors, 
-                            zmin=0, 
-                            zmax=num_of_jobs-1, 
-                            text=cluster_text,
-                            hovertemplate="Job: %{text}<br>%{x}<br>%{y}<extra></extra>"
-                        )
-                    ])
-            )
+        for grid in self.events.occupancy(checkpoints, num_of_hosts * ppn):
+
+            cluster = job_ids[grid].reshape(num_of_hosts, ppn).tolist()
+            cluster_text = labels[grid].reshape(num_of_hosts, ppn).tolist()
+
+            # Frames only update the values of the heatmap; the rest of the
+            # trace is inherited and validated once in the figure
+            frames.append({"data": [{"type": "heatmap", "z": cluster, "text": cluster_text}]})
 
         fig = go.Figure(
                 data=[
@@ -343,8 +463,9 @@ class Logger(object):
                         type="buttons",
                         buttons=[dict(label="Play", method="animate", args=[None])]
                     )]
-                ),
-                frames=frames
+                )
         )
 
-        return fig.to_json()
+        figure = fig.to_dict()
+        figure["frames"] = frames
+        return pio.to_json(figure, validate=False)
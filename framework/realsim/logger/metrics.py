@@ -0,0 +1,142 @@
+"""
+Online metrics of a simulation. A metrics sink is attached to a Logger and
+receives the same events from the compute engine; it keeps running summary
+statistics in constant memory instead of the records of every job, so that
+batch runs that only need the summaries can disable the retention of events.
+"""
+
+import os
+import sys
+from bisect import bisect_right, insort
+from math import nan
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from realsim.jobs.jobs import Job
+from realsim.cluster.cluster import Cluster
+import realsim.logger.logevts as evts
+
+
+class P2Quantile:
+    """Estimation of a quantile with the P-square algorithm of Jain and
+    Chlamtac; five markers are kept whatever the number of observations
+    """
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        # Heights and positions of the markers
+        self.heights: list[float] = list()
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2*p, 1 + 4*p, 3 + 2*p, 5]
+        self.increments = [0, p/2, p, (1 + p)/2, 1]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        if self.count <= 5:
+            insort(self.heights, x)
+            return
+
+        q = self.heights
+        n = self.positions
+
+        # Cell of the observation; the extreme markers follow the min and max
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = bisect_right(q, x) - 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Adjust the heights of the middle markers
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i+1] - n[i] > 1) or (d <= -1 and n[i-1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i+1] - n[i-1]) * (
+                        (n[i] - n[i-1] + d) * (q[i+1] - q[i]) / (n[i+1] - n[i]) +
+                        (n[i+1] - n[i] - d) * (q[i] - q[i-1]) / (n[i] - n[i-1]))
+                if not q[i-1] < height < q[i+1]:
+                    height = q[i] + d * (q[i+d] - q[i]) / (n[i+d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def value(self) -> float:
+        if self.count == 0:
+            return nan
+        if self.count <= 5:
+            return self.heights[round(self.p * (self.count - 1))]
+        return self.heights[2]
+
+
+class OnlineMetrics:
+    """Running waiting time, bounded slowdown, utilization, makespan and
+    throughput of the finished jobs
+    """
+
+    def __init__(self, quantiles: tuple[float, ...] = (0.5, 0.95), bound: float = 10.0):
+        self.quantiles = quantiles
+        # Runtime threshold of the bounded slowdown in seconds
+        self.bound = bound
+        self.cluster: Cluster
+
+    def setup(self, cluster: Cluster) -> None:
+        self.cluster = cluster
+        self.finished = 0
+        self.makespan = 0.0
+        self.waiting_sum = 0.0
+        self.slowdown_sum = 0.0
+        self.waiting_quantiles = [P2Quantile(p) for p in self.quantiles]
+        self.slowdown_quantiles = [P2Quantile(p) for p in self.quantiles]
+
+        # Integral of the allocated cores over time
+        self.core_seconds = 0.0
+        self.last_time = 0.0
+        self.used_cores = 0
+
+    def log(self, evt: type[evts.LogEvent], **kwargs) -> None:
+
+        if evt == evts.JobStart or evt == evts.JobFinish:
+            now = self.cluster.makespan
+            self.core_seconds += self.used_cores * (now - self.last_time)
+            self.last_time = now
+            self.used_cores = self.cluster.total_cores - self.cluster.get_idle_cores()
+
+        if evt == evts.JobFinish:
+            job: Job = kwargs["job"]
+            waiting = job.start_time - job.submit_time
+            runtime = job.finish_time - job.start_time
+            slowdown = max((waiting + runtime) / max(runtime, self.bound), 1)
+
+            self.finished += 1
+            self.makespan = max(self.makespan, job.finish_time)
+            self.waiting_sum += waiting
+            self.slowdown_sum += slowdown
+            for quantile in self.waiting_quantiles:
+                quantile.add(waiting)
+            for quantile in self.slowdown_quantiles:
+                quantile.add(slowdown)
+
+    def summary(self) -> dict:
+        finished = self.finished if self.finished else nan
+        makespan = self.makespan if self.makespan else nan
+        summary = {
+                "finished jobs": self.finished,
+                "makespan": self.makespan,
+                "throughput": self.finished / makespan,
+                "utilization": self.core_seconds / (self.cluster.total_cores * makespan),
+                "mean waiting time": self.waiting_sum / finished,
+                "mean bounded slowdown": self.slowdown_sum / finished,
+        }
+        for quantile in self.waiting_quantiles:
+            summary[f"waiting time p{quantile.p * 100:g}"] = quantile.value()
+        for quantile in self.slowdown_quantiles:
+            summary[f"bounded slowdown p{quantile.p * 100:g}"] = quantile.value()
+        return summary
@@ -0,0 +1,60 @@
+"""
+Compact summary of the jobs of a finished simulation. It holds only arrays of
+the submit, start and finish times keyed by job id, so it is cheap to send to
+other processes that compare their jobs against a baseline simulation.
+"""
+
+import numpy as np
+
+
+class JobsSummary:
+
+    def __init__(self, makespan: float, job_ids: np.ndarray, job_names: list[str],
+                 submit: np.ndarray, start: np.ndarray, finish: np.ndarray):
+
+        self.makespan = makespan
+
+        # Names of the jobs in their original order
+        self.keys = [f"{job_id}:{name}" for job_id, name in zip(job_ids.tolist(), job_names)]
+
+        # Job ids in ascending order and their times
+        order = np.argsort(job_ids)
+        self.order = order
+        self.job_ids = job_ids[order]
+        self.submit = submit[order]
+        self.start = start[order]
+        self.finish = finish[order]
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def positions(self, job_ids: np.ndarray) -> np.ndarray:
+        """Positions of job ids in the summary; all the ids must exist
+        """
+        positions = np.searchsorted(self.job_ids, job_ids)
+        if len(job_ids) and (positions.max() >= len(self.job_ids)
+                             or np.any(self.job_ids[positions] != job_ids)):
+            raise KeyError("Job ids missing from the summary")
+        return positions
+
+    def utilization(self, other: "JobsSummary") -> dict[str, dict]:
+        """Utilization metrics of each job in comparison to another (common
+        use: default scheduling) summary
+        """
+        positions = other.positions(self.job_ids)
+
+        # Utilization numbers
+        speedup = (other.finish[positions] - other.start[positions]) / (self.finish - self.start)
+        turnaround = (other.finish[positions] - other.submit[positions]) / (self.finish - self.submit)
+        waiting = (other.start[positions] - other.submit[positions]) - (self.start - self.submit)
+
+        # Boxplot points in the original order of the jobs
+        points = dict()
+        for idx in np.argsort(self.order).tolist():
+            points[self.keys[self.order[idx]]] = {
+                "speedup": float(speedup[idx]),
+                "turnaround": float(turnaround[idx]),
+                "waiting": float(waiting[idx])
+            }
+
+        return points
@@ -11,6 +11,8 @@ sys.path.append(os.path.abspath(
     os.path.join(os.path.dirname(__file__), '../../../')
 ))
 
+import numpy as np
+
 from realsim.scheduler.scheduler import Scheduler
 from realsim.jobs import Job
 
@@ -35,25 +37,22 @@ class Coscheduler(Scheduler, ABC):
         will gain/lose. Always spread first
         """
 
-        co_job_sigs = list(self.cluster.hosts[hostname].jobs.keys())
+        return float(self.host_alloc_scores([hostname], job)[0])
 
-        # If no signatures then spread
-        if co_job_sigs == []:
-            return job.max_speedup
+    def host_alloc_scores(self, hostnames: list[str], job: Job) -> np.ndarray:
+        """The host allocation condition for all the hosts given at once from
+        the summary of the loads residing in each host
+        """
 
-        # Get the worst possible speedup
-        first_co_job_name = co_job_sigs[0].split(":")[-1]
-        worst_speedup = self.database.heatmap[job.job_name][first_co_job_name]
-        worst_speedup = worst_speedup if worst_speedup is not None else 1
+        host_ids = [self.cluster.host_ids[hostname] for hostname in hostnames]
+        resident = self.cluster.host_loads[host_ids] > 0
 
-        for co_job_sig in co_job_sigs[1:]:
-            co_job_name = co_job_sig.split(":")[-1]
-            speedup = self.database.heatmap[job.job_name][co_job_name]
-            speedup = speedup if speedup is not None else 1
-            if speedup < worst_speedup:
-                worst_speedup = speedup
+        # Get the worst possible speedup; unknown speedups count as 1
+        speedups = np.nan_to_num(self.database.speedups[job.load_id], nan=1)
+        worst = np.min(np.where(resident, speedups, np.inf), axis=1, initial=np.inf)
 
-        return worst_speedup
+        # If no co-jobs then spread
+        return np.where(resident.any(axis=1), worst, job.max_speedup)
 
     @abstractmethod
     def deploy(self) -> bool:
@@ -6,12 +6,12 @@ sys.path.append(os.path.abspath(os.path.join(
 )))
 
 from realsim.jobs.jobs import Job
-from realsim.jobs.utils import deepcopy_list
 from realsim.scheduler.coscheduler import Coscheduler
 from realsim.cluster.host import Host
 
 from abc import ABC
 from math import inf
+import numpy as np
 
 
 class RanksCoscheduler(Coscheduler, ABC):
@@ -29,25 +29,47 @@ class RanksCoscheduler(Coscheduler, ABC):
         self.ranks_threshold = 1.0
 
     def update_ranks(self):
+        """Recompute the ranks of the whole waiting queue
+        """
 
-        self.ranks = {job.job_id : 0 for job in self.cluster.waiting_queue}
+        load_ids = [job.load_id for job in self.cluster.waiting_queue]
 
-        # Update ranks for each job
-        for i, job in enumerate(self.cluster.waiting_queue):
+        # Average speedup of every pair of waiting jobs; pairs with an unknown
+        # speedup (NaN) never pass the threshold
+        speedups = self.database.speedups[np.ix_(load_ids, load_ids)]
+        with np.errstate(invalid="ignore"):
+            good_pairs = ((speedups + speedups.T) / 2) > self.ranks_threshold
 
-            for co_job in self.cluster.waiting_queue[i+1:]:
+        # A job does not pair with itself
+        np.fill_diagonal(good_pairs, False)
 
-                job_speedup = self.database.heatmap[job.job_name][co_job.job_name]
-                co_job_speedup = self.database.heatmap[co_job.job_name][job.job_name]
+        self.ranks = {job.job_id: int(rank) 
+                      for job, rank in zip(self.cluster.waiting_queue, good_pairs.sum(axis=1))}
 
-                if job_speedup is None or co_job_speedup is None:
-                    continue
+    def good_partners(self, job: Job) -> list[int]:
+        """The ids of the other waiting jobs that make a good pair with job
+        """
 
-                avg_speedup = (job_speedup + co_job_speedup) / 2
+        partners = [wjob for wjob in self.cluster.waiting_queue if wjob.job_id != job.job_id]
+        load_ids = np.fromiter((wjob.load_id for wjob in partners), dtype=np.int64, count=len(partners))
 
-                if avg_speedup > self.ranks_threshold:
-                    self.ranks[job.job_id] += 1
-                    self.ranks[co_job.job_id] += 1
+        speedups = (self.database.speedups[job.load_id, load_ids] +
+                    self.database.speedups[load_ids, job.load_id]) / 2
+        with np.errstate(invalid="ignore"):
+            good_pairs = speedups > self.ranks_threshold
+
+        return [partners[i].job_id for i in np.flatnonzero(good_pairs)]
+
+    def waiting_queue_arrival(self, job: Job) -> None:
+        partners = self.good_partners(job)
+        self.ranks[job.job_id] = len(partners)
+        for job_id in partners:
+            self.ranks[job_id] += 1
+
+    def waiting_queue_departure(self, job: Job) -> None:
+        for job_id in self.good_partners(job):
+            self.ranks[job_id] -= 1
+        self.ranks.pop(job.job_id)
 
     def setup(self):
 
@@ -74,10 +96,7 @@ class RanksCoscheduler(Coscheduler, ABC):
 
         deployed = False
 
-        # Update the rank of each job before scheduling them
-        # self.update_ranks()
-
-        waiting_queue = deepcopy_list(self.cluster.waiting_queue[:self.queue_depth])
+        waiting_queue = list(self.cluster.waiting_snapshot(0, self.queue_depth))
         waiting_queue.sort(key=lambda job: self.waiting_queue_reorder(job),
                            reverse=True)
 
@@ -106,7 +125,7 @@ class RanksCoscheduler(Coscheduler, ABC):
         if len(self.cluster.waiting_queue) <= 1:
             return False
 
-        execution_list = deepcopy_list(self.cluster.execution_list)
+        execution_list = list(self.cluster.execution_snapshot())
         execution_list.sort(key=lambda job: job.wall_time + job.start_time - self.cluster.makespan)
 
         blocked_job = self.cluster.waiting_queue[0]
@@ -135,7 +154,7 @@ class RanksCoscheduler(Coscheduler, ABC):
         # Find job(s) that can backfill the execution list
 
         # Get the backfilling candidates
-        backfilling_jobs = deepcopy_list(self.cluster.waiting_queue[1:self.backfill_depth+1])
+        backfilling_jobs = list(self.cluster.waiting_snapshot(1, self.backfill_depth+1))
 
         # Ascending sorting by their wall time
         backfilling_jobs.sort(key=lambda b_job: b_job.wall_time)
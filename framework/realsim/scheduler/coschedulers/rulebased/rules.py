@@ -6,8 +6,7 @@ sys.path.append(os.path.abspath(os.path.join(
     os.path.dirname(__file__), "../../../../"
 )))
 
-from realsim.jobs.jobs import Job, JobCharacterization
-from realsim.jobs.utils import deepcopy_list
+from realsim.jobs.jobs import Job, JobCharacterization, JobView
 from realsim.scheduler.coscheduler import Coscheduler
 import math
 
@@ -114,6 +113,10 @@ class RulesCoscheduler(Coscheduler, ABC):
 
     def allocation_as_compact(self, job: Job) -> bool:
 
+        # The views of the snapshots are read-only; the allocation changes
+        # the job itself
+        job = JobView.unwrap(job)
+
         procset = self.assign_nodes(job.full_node_cores, self.cluster.total_procs)
 
         # Check if the job can be allocated for compact execution
@@ -134,7 +137,7 @@ class RulesCoscheduler(Coscheduler, ABC):
 
         deployed = False
 
-        waiting_queue = deepcopy_list(self.cluster.waiting_queue)
+        waiting_queue = list(self.cluster.waiting_snapshot())
 
         while waiting_queue != []:
 
@@ -175,10 +178,9 @@ class RulesCoscheduler(Coscheduler, ABC):
                     deployed = True
                     continue
 
-            # All the allocation tries have failed. Return the job at the first
-            # out position and reassign the waiting queue of the cluster
-            waiting_queue.insert(0, job)
-            self.cluster.waiting_queue = waiting_queue
+            # All the allocation tries have failed. The job was never removed
+            # from the waiting queue of the cluster and the jobs deployed
+            # before it were, so it stays at the first out position
             break
 
         return deployed
@@ -212,7 +214,7 @@ class RulesCoscheduler(Coscheduler, ABC):
 
         blocked_job = self.cluster.waiting_queue[0]
 
-        execution_list = deepcopy_list(self.cluster.execution_list)
+        execution_list = list(self.cluster.execution_snapshot())
         # The blocked job can be co-scheduled
         # This means it can either fit inside an existing execution unit
         # or it waits until whole xunits finish execution
@@ -264,7 +266,7 @@ class RulesCoscheduler(Coscheduler, ABC):
         estimations = list()
         for xunit in xunits_for_colocation:
             aggr_cores = 0
-            xunit_copy = deepcopy_list(xunit)
+            xunit_copy = list(xunit)
             last_job = xunit_copy[-1]
             if type(last_job) == EmptyJob:
                 xunit_copy.remove(last_job)
@@ -287,7 +289,7 @@ class RulesCoscheduler(Coscheduler, ABC):
         #     estimated_start_time = estimated_start_time_merge
 
         # In finding the possible backfillers
-        waiting_queue = deepcopy_list(self.cluster.waiting_queue[1:self.backfill_depth+1])
+        waiting_queue = list(self.cluster.waiting_snapshot(1, self.backfill_depth+1))
 
         while waiting_queue != []:
 
@@ -6,6 +6,7 @@ from functools import reduce
 from itertools import islice
 from typing import TYPE_CHECKING
 from math import ceil
+import numpy as np
 
 from procset import ProcSet
 
@@ -16,13 +17,27 @@ sys.path.append(os.path.abspath(
         )
     ))
 
-from realsim.jobs import Job
+from realsim.jobs import Job, JobView
 from realsim.database import Database
 from realsim.cluster.cluster import Cluster
 from realsim.cluster.host import Host
 from realsim.logger.logger import Logger
 from realsim.compengine import ComputeEngine
 
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores in descending order; ties keep their
+    original order as in a stable descending sort
+    """
+    keys = -scores
+    if k < len(keys):
+        kth = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= kth)
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind="stable")][:k]
+
+
 class Scheduler(ABC):
     """Scheduler class is the abstract base class for all the scheduling
     algorithms that feed the simulation. It provides basic utility methods
@@ -50,6 +65,8 @@ class Scheduler(ABC):
         self.queue_depth = None # None is equivalent to using the whole waiting queue
         self.backfill_enabled: bool = False # The most basic algorithm will not use backfill
         self.backfill_depth = 100 # How far we reach for backfilling
+        self.time_dependent: bool = False # Repeat failed passes even if no job arrived or finished
+        self.head_only: bool = False # A failed pass depends only on the head of the waiting queue
 
     def orig_find_suitable_nodes(self, 
                             req_cores: int, 
@@ -80,22 +97,23 @@ class Scheduler(ABC):
 
     def find_suitable_nodes(self, 
                             req_cores: int, 
-                            socket_conf: tuple) -> dict[str, list[ProcSet]]:
+                            socket_conf: tuple,
+                            exhaustive: bool = False) -> dict[str, list[ProcSet]]:
         """ Returns hosts and their procsets that a job can use as resources
         + req_cores   : required cores for the job
         + socket_conf : under a certain socket mapping/configuration
+        + exhaustive  : return every suitable host instead of stopping as soon
+                        as the required cores are covered
         """
         cores_per_host = sum(socket_conf)
         to_be_allocated = dict()
-        for hostname, host in self.cluster.hosts.items():
-            # If under the specifications of the required cores and socket 
-            # allocation *takes advantage of short circuit for idle hosts
-            if host.state == Host.IDLE or reduce(lambda x, y: x[0] <= len(x[1]) and y[0] <= len(y[1]), list(zip(socket_conf, host.sockets))):
-                req_cores -= cores_per_host
-                to_be_allocated.update({hostname: [
-                    ProcSet.from_str(' '.join([str(x) for x in p_set[:socket_conf[i]]]))
-                    for i, p_set in enumerate(host.sockets)]
-                })
+        # The index of the cluster provides the idle hosts and the hosts with
+        # enough free cores per socket in order
+        for hostname in self.cluster.suitable_hosts(socket_conf):
+            req_cores -= cores_per_host
+            to_be_allocated[hostname] = self.cluster.hosts[hostname].first_free_cores(socket_conf)
+            if req_cores <= 0 and not exhaustive:
+                break
 
         # If the amount of cores needed is covered then return the list of possible
         # hosts
@@ -110,6 +128,12 @@ class Scheduler(ABC):
         """
         return 1.0
 
+    def host_alloc_scores(self, hostnames: list[str], job: Job) -> np.ndarray:
+        """The host allocation condition for each of the hosts given
+        """
+        return np.array([self.host_alloc_condition(hostname, job) for hostname in hostnames],
+                        dtype=np.float64)
+
     def allocation(self, job: Job, socket_conf: tuple) -> bool:
         """We allocate first to the idle hosts and then to the in use hosts
         """
@@ -118,33 +142,40 @@ class Scheduler(ABC):
         + socket_conf: socket mapping/configuration for the job
         """
 
-        job.socket_conf = socket_conf
+        # The views of the snapshots are read-only; the allocation changes
+        # the job itself
+        job = JobView.unwrap(job)
 
-        # Get only the suitable hosts
+        # Get only the suitable hosts; all of them are needed only if they
+        # are going to be ranked by a host allocation condition
+        ranked = type(self).host_alloc_condition is not Scheduler.host_alloc_condition or\
+                type(self).host_alloc_scores is not Scheduler.host_alloc_scores
         suitable_hosts = self.find_suitable_nodes(job.num_of_processes,
-                                                  socket_conf)
+                                                  socket_conf,
+                                                  exhaustive=ranked)
 
-        # If no suitable hosts where found
+        # If no suitable hosts where found; the job is left untouched
         if suitable_hosts == dict():
             return False
 
-        # Apply the colocation condition
-        suitable_hosts = dict(
-                sorted(suitable_hosts.items(), key=lambda it: self.host_alloc_condition(it[0], job), reverse=True)
-        )
+        # The socket configuration is set once the job is going to be
+        # deployed but before the hosts are ranked, so that a host allocation
+        # condition can read it
+        job.socket_conf = socket_conf
 
         # Calculate how many cores per node and the number 
         # of nodes needed to satisfy the job
         needed_ppn = sum(job.socket_conf)
         needed_hosts = ceil(job.num_of_processes / needed_ppn)
 
-        req_hosts = needed_hosts
-        req_hosts_psets = list()
-        for hostname, psets in suitable_hosts.items():
-            req_hosts_psets.append((hostname, psets))
-            req_hosts -= 1
-            if req_hosts == 0:
-                break
+        # Apply the colocation condition; only the best hosts are needed
+        hostnames = list(suitable_hosts.keys())
+        if ranked:
+            scores = self.host_alloc_scores(hostnames, job)
+            hostnames = [hostnames[i] for i in top_k(scores, needed_hosts)]
+
+        req_hosts_psets = [(hostname, suitable_hosts[hostname])
+                           for hostname in hostnames[:needed_hosts]]
 
         self.compeng.deploy_job_to_hosts(req_hosts_psets, job)
 
@@ -174,6 +205,16 @@ class Scheduler(ABC):
         """
         return 1.0
 
+    def waiting_queue_arrival(self, job: Job) -> None:
+        """Called when a job enters the waiting queue
+        """
+        pass
+
+    def waiting_queue_departure(self, job: Job) -> None:
+        """Called when a job leaves the waiting queue
+        """
+        pass
+
     @abstractmethod
     def deploy(self) -> bool:
         """Abstract method to deploy the new execution list to the cluster
@@ -6,8 +6,6 @@ sys.path.append(os.path.abspath(os.path.join(
     os.path.dirname(__file__), "../../../"
 )))
 
-from realsim.cluster.host import Host
-from realsim.jobs.utils import deepcopy_list
 from .fifo import FIFOScheduler
 from math import inf
 
@@ -21,73 +19,6 @@ class ConservativeScheduler(FIFOScheduler):
         FIFOScheduler.__init__(self)
         self.backfill_enabled = True
 
-    def reserve(self, free_slots, execution_list, blocked_job):
-
-        execution_list.sort(key=lambda job: job.wall_time + job.start_time - self.cluster.makespan)
-        min_estimated_time = inf
-        rslots = free_slots # Reservation slots
-
-        for xjob in execution_list:
-
-            rslots += xjob.assigned_hosts
-
-            if len(rslots) >= blocked_job.full_socket_nodes:
-                min_estimated_time = xjob.wall_time - (self.cluster.makespan - xjob.start_time)
-                break
-
-        # If a job couldn't reserve cores then cancel backfill at this point
-        if not min_estimated_time < inf:
-            return False
-        else:
-            execution_list.append(blocked_job)
-            free_slots -= rslots
-
-    # find_reservation([], 0, blocked_job, idle_hosts, waiting_queue, execution_list)
-
-    def find_reservation(self, reserves, start_time, blocked_job, free_slots, waiting_queue, execution_list):
-
-        if not start_time < inf:
-            return reserves
-
-        # Calculate the estimated start time of blocked job
-        execution_list.sort(key=lambda job: job.wall_time + job.start_time - self.cluster.makespan)
-        min_estimated_time = inf
-        rslots = free_slots
-        jobs_to_finish = list()
-
-        for xjob in execution_list:
-
-            rslots += xjob.assigned_hosts
-            jobs_to_finish.append(xjob)
-
-            if len(rslots) >= blocked_job.full_socket_nodes:
-                min_estimated_time = xjob.wall_time - (self.cluster.makespan - xjob.start_time)
-                break
-
-        reserves.append(start_time + min_estimated_time)
-        free_slots = [name for name in free_slots if name not in rslots]
-        
-        for xjob in execution_list:
-            xjob.remaining_time -= min_estimated_time
-        execution_list = [xjob for xjob in execution_list if xjob.remaining_time > 0]
-        execution_list.append(blocked_job)
-        
-        if waiting_queue != []:
-            blocked_job = waiting_queue[0]
-        else:
-            return reserves
-        waiting_queue.remove(blocked_job)
-
-        return self.find_reservation(
-                reserves,
-                start_time + min_estimated_time,
-                blocked_job,
-                free_slots,
-                waiting_queue,
-                execution_list
-        )
-
-
     def backfill(self) -> bool:
 
         deployed = False
@@ -95,24 +26,45 @@ class ConservativeScheduler(FIFOScheduler):
         if len(self.cluster.waiting_queue) <= 1:
             return False
 
-        waiting_queue = deepcopy_list(self.cluster.waiting_queue[1:self.backfill_depth+1])
-        blocked_job = waiting_queue[0]
-        waiting_queue.remove(blocked_job)
-        execution_list = deepcopy_list(self.cluster.execution_list)
+        profile = self.cluster.profile
+        now = self.cluster.makespan
+
+        # Every job in the queue gets a reservation at the earliest time it
+        # fits without delaying the reservations of the jobs before it
+        profile.start_pass(len(self.cluster.idle_hosts), now)
 
-        # Get all the idle hosts
-        idle_hosts = [host for host in self.cluster.hosts.values() if host.state == Host.IDLE]
+        # The blocked job at the head of the queue cannot start now
+        blocked_job = self.cluster.waiting_queue[0]
+        start = profile.earliest_fit(blocked_job.full_socket_nodes, blocked_job.wall_time)
+
+        # If a job couldn't reserve cores then cancel backfill at this point
+        if not start < inf:
+            return False
 
-        reserves = self.find_reservation([], 0, blocked_job, idle_hosts, waiting_queue, execution_list)
+        profile.reserve(start, blocked_job.wall_time, blocked_job.full_socket_nodes)
 
         # Get the backfilling candidates
-        backfilling_jobs = deepcopy_list(self.cluster.waiting_queue[1:self.backfill_depth+1])
+        backfilling_jobs = self.cluster.waiting_snapshot(1, self.backfill_depth+1)
+
+        for b_job in backfilling_jobs:
 
-        for i, rtime in enumerate(reserves):
+            start = profile.earliest_fit(b_job.full_socket_nodes, b_job.wall_time)
 
-            if backfilling_jobs[i].wall_time <= rtime:
+            if not start < inf:
+                continue
 
-                if self.compact_allocation(backfilling_jobs[i]):
+            # Backfill the job if its reservation is now; otherwise keep the
+            # reservation so that later jobs do not delay it. If the nodes
+            # are free now but the cores of their sockets do not fit the job,
+            # it is reserved at the earliest time after now
+            if start == now:
+                if self.compact_allocation(b_job):
                     deployed = True
-        
+                else:
+                    start = profile.earliest_fit(b_job.full_socket_nodes, b_job.wall_time, now)
+                    if not start < inf:
+                        continue
+
+            profile.reserve(start, b_job.wall_time, b_job.full_socket_nodes)
+
         return deployed
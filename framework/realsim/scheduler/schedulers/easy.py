@@ -6,8 +6,6 @@ sys.path.append(os.path.abspath(os.path.join(
     os.path.dirname(__file__), "../../../"
 )))
 
-from realsim.cluster.host import Host
-from realsim.jobs.utils import deepcopy_list
 from .fifo import FIFOScheduler
 from math import inf
 
@@ -28,27 +26,12 @@ class EASYScheduler(FIFOScheduler):
         if len(self.cluster.waiting_queue) <= 1:
             return False
 
-        execution_list = deepcopy_list(self.cluster.execution_list)
-        execution_list.sort(key=lambda job: job.wall_time + job.start_time - self.cluster.makespan)
-
         blocked_job = self.cluster.waiting_queue[0]
 
-        # Get all the idle hosts
-        idle_hosts = [host for host in self.cluster.hosts.values() if host.state == Host.IDLE]
-
-        # Find the minimum estimated start time of the job
-
-        # Calculate the number of idle hosts needed
-        aggr_hosts = len(idle_hosts)
-        min_estimated_time = inf
-
-        for xjob in execution_list:
-
-            aggr_hosts += len(xjob.assigned_hosts)
-
-            if aggr_hosts >= blocked_job.full_socket_nodes:
-                min_estimated_time = xjob.wall_time - (self.cluster.makespan - xjob.start_time)
-                break
+        # Find the minimum estimated start time of the job; the time the
+        # executing jobs are estimated to release the missing hosts
+        missing_hosts = blocked_job.full_socket_nodes - len(self.cluster.idle_hosts)
+        min_estimated_time = self.cluster.profile.earliest_release(missing_hosts) - self.cluster.makespan
 
         # If a job couldn't reserve cores then cancel backfill at this point
         if not min_estimated_time < inf:
@@ -57,7 +40,7 @@ class EASYScheduler(FIFOScheduler):
         # Find job(s) that can backfill the execution list
 
         # Get the backfilling candidates
-        backfilling_jobs = deepcopy_list(self.cluster.waiting_queue[1:self.backfill_depth+1])
+        backfilling_jobs = self.cluster.waiting_snapshot(1, self.backfill_depth+1)
 
         # Scan through the rest of the jobs to see if any is fit for backfilling
         for b_job in backfilling_jobs:
@@ -6,7 +6,6 @@ sys.path.append(os.path.abspath(os.path.join(
 )))
 
 from realsim.scheduler.scheduler import Scheduler
-from realsim.jobs.utils import deepcopy_list
 
 
 class FIFOScheduler(Scheduler):
@@ -16,6 +15,7 @@ class FIFOScheduler(Scheduler):
 
     def __init__(self):
         Scheduler.__init__(self)
+        self.head_only = True
 
     def setup(self):
         pass
@@ -23,11 +23,9 @@ class FIFOScheduler(Scheduler):
     def deploy(self) -> bool:
 
         deployed = False
-        waiting_queue = deepcopy_list(self.cluster.waiting_queue[:self.queue_depth])
 
-        while waiting_queue != []:
+        for job in self.cluster.waiting_snapshot(0, self.queue_depth):
 
-            job = self.pop(waiting_queue)
             if self.compact_allocation(job):
                 deployed = True
             else:
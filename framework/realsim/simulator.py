@@ -1,5 +1,5 @@
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from multiprocessing import Manager
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional
 import os
 import sys
 import math
@@ -11,15 +11,19 @@ sys.path.append(os.path.abspath(os.path.join(
     os.path.dirname(__file__), "../"
 )))
 
-from realsim.database import Database
+from realsim.database import Database, replayable
 from realsim.cluster.cluster import Cluster
 from realsim.logger.logger import Logger
 from realsim.compengine import ComputeEngine
 
 
-def run_sim(core):
+def run_sim(core, compact_gantt: bool = False):
 
-    database, cluster, scheduler, logger, compengine, comm_queue = core
+    database, cluster, scheduler, logger, compengine = core
+
+    # The stream of jobs of the database is opened in the worker
+    database.setup()
+    compengine.setup_preloaded_jobs()
 
     cluster.setup()
     scheduler.setup()
@@ -27,7 +31,7 @@ def run_sim(core):
 
     # The stopping condition is for the waiting queue and the execution list
     # to become empty
-    while database.preloaded_queue != [] or cluster.waiting_queue != [] or cluster.execution_list != []:
+    while database.has_pending_arrivals() or cluster.waiting_queue != [] or cluster.execution_list != []:
         compengine.sim_step()
 
     if cluster.get_idle_cores() != cluster.free_cores:
@@ -36,29 +40,17 @@ def run_sim(core):
         for name, host in cluster.hosts.items():
             print(name, host.sockets)
 
-    default_list = comm_queue.get()
-    comm_queue.put(default_list)
-
-    # When finished then use the default logger to get per job utilization
-    # results
-    default_cluster_makespan = default_list[0]
-    default_logger = default_list[1]
-
     # profiler = Profile()
     # profiler.enable()
 
     data = {
             # Graphs
             # "Resource usage": logger.get_resource_usage(),
-            "Gantt diagram": logger.get_gantt_representation(),
+            "Gantt diagram": logger.get_gantt_representation(compact=compact_gantt),
             "Unused cores": logger.get_unused_cores_graph(),
-            "Jobs utilization": logger.get_jobs_utilization(default_logger),
             "Jobs throughput": logger.get_jobs_throughput(),
             "Waiting queue": logger.get_waiting_queue_graph(),
             # "Cluster history": logger.get_animated_cluster(),
-            
-            # Extra metrics
-            "Makespan speedup": default_cluster_makespan / cluster.makespan,
 
             "Workload": logger.get_workload(),
     }
@@ -72,12 +64,9 @@ def run_sim(core):
 
     # Return:
     # 1. Plot data for the resource usage in json format
-    # 2. Jobs' utilization:
-    #       a. Speedup for each job
-    #       b. Turnaround ratio for each job
-    #       c. Waiting time difference for each job
-    # 3. Makespan speedup
-    return data
+    # 2. The summary of the jobs to compute the metrics relative to the
+    #    default scheduler after all the simulations finish
+    return data, logger.get_jobs_summary()
 
 class Simulation:
     """The entry point of a simulation for scheduling and scheduling algorithms.
@@ -91,18 +80,32 @@ class Simulation:
                  # cluster
                  nodes: int, socket_conf: tuple, queue_size: int,
                  # scheduler algorithms bundled with inputs
-                 schedulers_bundle):
+                 schedulers_bundle,
+                 # compute engine mode (ComputeEngine or VectorComputeEngine)
+                 compengine_cls: type[ComputeEngine] = ComputeEngine,
+                 # pool of workers shared with other simulations if given
+                 executor: Optional[Executor] = None,
+                 # merge the Gantt diagram into one trace per colour
+                 compact_gantt: bool = False):
 
         self.default = "Conservative Scheduler"
-        self.executor = ProcessPoolExecutor()
-
-        self.manager = Manager()
-        self.comm_queue = self.manager.Queue(maxsize=1)
+        # Name of the results of the default scheduler if different
+        self.default_label = None
+        # A shared pool is not shut down; its workers outlive the simulation
+        self.owns_executor = executor is None
+        self.executor = executor if executor is not None else ProcessPoolExecutor()
+        self.compact_gantt = compact_gantt
 
         self.sims = dict()
         self.futures = dict()
         self.results = dict()
 
+        # Every scheduler replays the whole jobs set; a factory of streams
+        # gives each database a fresh stream in its worker (it must be
+        # picklable for a process pool), a one-shot iterator is materialized
+        # once
+        jobs_set = replayable(jobs_set)
+
         for sched_class, hyperparams in schedulers_bundle:
 
             # Declare a database for each simulation step
@@ -116,9 +119,6 @@ class Simulation:
                 cluster.queue_size = math.inf
             else:
                 cluster.queue_size = queue_size
-            
-            # Setup the databse
-            database.setup()
 
             # Initialize scheduler
             scheduler = sched_class(**hyperparams)
@@ -126,80 +126,53 @@ class Simulation:
             # Initalize logger
             logger = Logger()
 
-            # Initialize the Compute Engine and prepare the loaded workload
-            compeng = ComputeEngine(database, cluster, scheduler, logger)
-            compeng.setup_preloaded_jobs()
-
-            # The default simulation will be executed by the main process
-            if sched_class.name == self.default:
-                self.default_database = database
-                self.default_cluster = cluster
-                self.default_scheduler = scheduler
-                self.default_logger = logger
-                self.default_compengine = compeng
-                continue
+            # Initialize the Compute Engine; the database and the loaded
+            # workload are set up in the worker
+            compeng = compengine_cls(database, cluster, scheduler, logger)
 
-            # Record of a simulation
+            # Record of a simulation; the default scheduler runs in the pool
+            # like any other
             self.sims[scheduler.name] = (database,
                                          cluster, 
                                          scheduler, 
                                          logger, 
-                                         compeng,
-                                         self.comm_queue)
+                                         compeng)
 
     def set_default(self, name):
-        # Set name for default scheduling algorithm
-        self.default = name
+        # Set name for default scheduling algorithm; a name that is not one of
+        # the schedulers labels the results of the current default
+        if name in self.sims:
+            self.default = name
+        else:
+            self.default_label = name
 
     def run(self):
 
         # Fork out the workers
         for policy, sim_args in self.sims.items():
             print(policy, "submitted")
-            self.futures[policy] = self.executor.submit(run_sim, sim_args)
-
-        print("Running the default scheduler")
-
-        # Execute the default scheduler
-        self.default_cluster.setup()
-        self.default_scheduler.setup()
-        self.default_logger.setup()
-
-        # The stopping condition is for the waiting queue and the execution list
-        # to become empty
-        while self.default_database.preloaded_queue != [] or self.default_cluster.waiting_queue != [] or self.default_cluster.execution_list != []:
-            self.default_compengine.sim_step()
-
-        # Submit to the shared list the results
-        self.comm_queue.put([self.default_cluster.makespan, self.default_logger])
-
-        # Wait until all the futures are complete
-        self.executor.shutdown(wait=True)
+            self.futures[policy] = self.executor.submit(run_sim, sim_args, self.compact_gantt)
 
+        # Wait until all the futures are complete; with a shared pool the
+        # results are awaited in get_results
+        if self.owns_executor:
+            self.executor.shutdown(wait=True)
 
     def get_results(self):
 
-        # Set results for default scheduler
-        data = {
-                # "Resource usage": self.default_logger.get_resource_usage(),
-                "Gantt diagram": self.default_logger.get_gantt_representation(),
-                "Unused cores": self.default_logger.get_unused_cores_graph(),
-                "Jobs utilization": {},
-                "Jobs throughput": self.default_logger.get_jobs_throughput(),
-                "Waiting queue": self.default_logger.get_waiting_queue_graph(),
-                #"Cluster history": self.default_logger.get_animated_cluster(),
-                "Makespan speedup": 1.0,
-                "Workload": self.default_logger.get_workload()
-        }
-
-        self.default_logger.get_animated_cluster()
+        runs = {policy: future.result() for policy, future in self.futures.items()}
 
-        self.results[self.default] = data
-
-        for policy, future in self.futures.items():
-
-            # Get the results
-            self.results[policy] = future.result()
+        # Join the metrics relative to the default scheduler
+        _, default_summary = runs[self.default]
+        for policy, [data, summary] in runs.items():
+            if policy == self.default:
+                data["Jobs utilization"] = {}
+                data["Makespan speedup"] = 1.0
+                if self.default_label is not None:
+                    policy = self.default_label
+            else:
+                data["Jobs utilization"] = summary.utilization(default_summary)
+                data["Makespan speedup"] = default_summary.makespan / summary.makespan
+            self.results[policy] = data
 
         return self.results
-
@@ -0,0 +1,66 @@
+import pytest
+
+import numpy as np
+from procset import ProcSet
+from realsim.cluster.cluster import Cluster
+from realsim.cluster.host import Host, CoreBitmap
+
+
+def occupy(cluster, hostname, psets):
+    host = cluster.hosts[hostname]
+    for i, pset in enumerate(psets):
+        host.sockets[i] -= pset
+    host.jobs[len(host.jobs)] = psets
+    host.state = Host.ALLOCATED
+    cluster.reindex_host(hostname)
+
+def test_first_free_cores_spans_intervals():
+    host = Host((4, 4), 1)
+    host.sockets[0] -= ProcSet(2)
+    assert host.first_free_cores((2, 3)) == [ProcSet((1, 1), (3, 3)), ProcSet((5, 7))]
+
+def test_suitable_hosts_in_order():
+    cluster = Cluster(4, (4, 4))
+    occupy(cluster, "host1", cluster.hosts["host1"].first_free_cores((2, 2)))
+    occupy(cluster, "host2", cluster.hosts["host2"].first_free_cores((4, 2)))
+
+    assert list(cluster.suitable_hosts((4, 4))) == ["host0", "host3"]
+    assert list(cluster.suitable_hosts((2, 2))) == ["host0", "host1", "host3"]
+    assert list(cluster.suitable_hosts((0, 2))) == ["host0", "host1", "host2", "host3"]
+
+def test_host_returns_to_idle():
+    cluster = Cluster(2, (4, 4))
+    psets = cluster.hosts["host0"].first_free_cores((2, 2))
+    occupy(cluster, "host0", psets)
+
+    host = cluster.hosts["host0"]
+    for i, pset in enumerate(host.jobs.pop(0)):
+        host.sockets[i] = host.sockets[i].union(pset)
+    host.state = Host.IDLE
+    cluster.reindex_host("host0")
+
+    assert cluster.idle_hosts == [0, 1]
+    assert cluster.partial_hosts == {}
+
+def test_bitmap_host_matches_procset_host():
+    cluster = Cluster(2, (40, 40), core_allocator="bitmap")
+    host = cluster.hosts["host1"]
+    cores = host.first_free_cores((30, 5))
+    host.allocate(cores)
+
+    assert host.free_cores_per_socket() == (10, 35)
+    assert host.to_procsets(cores) == [ProcSet((81, 110)), ProcSet((121, 125))]
+    assert host.sockets == [ProcSet((111, 120)), ProcSet((126, 160))]
+    assert cluster.core_bitmap.count(81, 160) == 45
+
+    host.release(cores)
+    assert host.sockets == [ProcSet((81, 120)), ProcSet((121, 160))]
+
+@pytest.mark.parametrize("first, last, k", [(1, 200, 5), (60, 140, 100), (63, 64, 2), (130, 191, 1), (10, 20, 0)])
+def test_bitmap_first_free_stops_after_k(first, last, k):
+    bitmap = CoreBitmap(256)
+    free = np.array([c for c in range(1, 256) if c % 3 != 0 or c in (63, 64, 128)], dtype=np.int64)
+    bitmap.set(free)
+
+    expected = free[(free >= first) & (free <= last)][:k]
+    assert bitmap.first_free(first, last, k).tolist() == expected.tolist()
@@ -0,0 +1,86 @@
+import pytest
+
+from math import inf
+from random import Random
+from realsim.cluster.profile import AvailabilityProfile
+
+
+@pytest.fixture
+def executing(make_job):
+    """Factory of jobs executing on nodes hosts since start time
+    """
+    def executing(job_id, nodes, start_time, wall_time):
+        job = make_job(job_id, wall_time)
+        job.assigned_hosts = [f"host{i}" for i in range(nodes)]
+        job.start_time = start_time
+        return job
+    return executing
+
+@pytest.fixture
+def profile(executing):
+    profile = AvailabilityProfile()
+    profile.add(executing(0, 2, 0, 30))
+    profile.add(executing(1, 1, 0, 10))
+    profile.add(executing(2, 3, 5, 15))
+    return profile
+
+def test_releases_in_time_order(profile):
+    assert sorted(time for time, _ in profile.jobs.values()) == [10, 20, 30]
+    assert profile.released_by(9) == 0
+    assert profile.released_by(20) == 4
+    assert profile.earliest_release(2) == 20
+    assert profile.earliest_release(7) == inf
+
+def test_remove_release(profile, executing):
+    profile.remove(executing(2, 3, 5, 15))
+    assert sorted(time for time, _ in profile.jobs.values()) == [10, 30]
+    assert profile.earliest_release(2) == 30
+
+def test_pass_starts_from_idle_nodes(profile):
+    profile.start_pass(1, 10)
+    assert profile.steps() == [(10, 1), (20, 4), (30, 6)]
+
+def test_earliest_fit_respects_reservations(profile):
+    # One idle node now; two nodes are free from 10 and five from 20
+    profile.start_pass(1, 0)
+    assert profile.earliest_fit(2, 5) == 10
+    profile.reserve(10, 20, 2)
+    # The reservation holds two nodes from 10 up to 30
+    assert profile.earliest_fit(1, 5) == 0
+    assert profile.earliest_fit(1, 5, after=0) == 20
+    assert profile.earliest_fit(1, 15) == 20
+    assert profile.earliest_fit(3, 5) == 20
+    assert profile.earliest_fit(4, 5) == 30
+    assert profile.earliest_fit(8, 5) == inf
+
+def test_pass_ignores_releases_that_change_during_it(profile, executing):
+    profile.start_pass(1, 0)
+    profile.add(executing(3, 4, 0, 5))
+    assert profile.earliest_fit(5, 5) == 20
+
+    # The release is applied once the pass ends
+    assert profile.released_by(5) == 4
+    assert profile.earliest_release(5) == 10
+
+def test_earliest_fit_matches_a_scan_of_the_steps(executing):
+    rng = Random(7)
+    profile = AvailabilityProfile()
+    for job_id in range(50):
+        profile.add(executing(job_id, rng.randint(1, 3), 0, rng.choice(range(10, 500, 10))))
+
+    def scan(steps, nodes, duration):
+        for idx, (start, _) in enumerate(steps):
+            window = [free for time, free in steps[idx:] if time < start + duration]
+            if min(window) >= nodes:
+                return start
+        return inf
+
+    for now in [0, 100, 250]:
+        profile.start_pass(2, now)
+        for _ in range(30):
+            nodes = rng.randint(1, 12)
+            duration = rng.choice(range(5, 300, 5))
+            start = profile.earliest_fit(nodes, duration)
+            assert start == scan(profile.steps(), nodes, duration)
+            if start < inf:
+                profile.reserve(start, duration, nodes)
@@ -0,0 +1,36 @@
+import pytest
+
+from math import inf
+from realsim.compengine import EventCalendar
+
+
+@pytest.fixture
+def calendar():
+    return EventCalendar()
+
+def test_empty_calendar(calendar):
+    assert calendar.next_time(0) == inf
+    assert calendar.pop_finished(100) == []
+
+def test_arrivals_in_the_past_are_skipped(calendar, make_job):
+    calendar.schedule_arrival(make_job(0, submit_time=5))
+    calendar.schedule_arrival(make_job(1, submit_time=20))
+    assert calendar.next_time(0) == 5
+    assert calendar.next_time(5) == 20
+
+def test_rescheduled_finish_invalidates_previous(calendar, make_job):
+    job = make_job(0)
+    calendar.schedule_finish(job, 10)
+    calendar.schedule_finish(job, 15)
+    assert calendar.next_time(0) == 15
+    assert calendar.remaining_time(job, 5) == 10
+    assert calendar.pop_finished(15) == [job]
+    assert calendar.next_time(15) == inf
+
+def test_simultaneous_finishes(calendar, make_job):
+    jobs = [make_job(i) for i in range(3)]
+    for job in jobs:
+        calendar.schedule_finish(job, 10)
+    calendar.schedule_finish(make_job(3), 11)
+    assert sorted(job.job_id for job in calendar.pop_finished(10)) == [0, 1, 2]
+    assert calendar.next_time(10) == 11
@@ -0,0 +1,33 @@
+import pytest
+
+from realsim.compengine import ExecutionState
+
+
+def test_slots_stay_dense(make_job):
+    state = ExecutionState(capacity=2)
+    jobs = [make_job(i, 10 * (i + 1)) for i in range(5)]
+    for job in jobs:
+        state.add(job, job.remaining_time)
+
+    assert len(state) == 5
+    state.remove(jobs[1])
+    state.remove(jobs[0])
+
+    assert len(state) == 3
+    for job in jobs[2:]:
+        slot = state.slots[job.job_id]
+        assert state.jobs[slot] is job
+        assert state.finish_time[slot] == job.remaining_time
+    assert (state.finish_time[3:] == float("inf")).all()
+    assert (state.stamp[3:] == -1).all()
+
+def test_finished_jobs_follow_finish_times(make_job):
+    state = ExecutionState(capacity=2)
+    jobs = [make_job(i, 10) for i in range(3)] + [make_job(3, 5)]
+    for job in jobs:
+        state.add(job, job.remaining_time)
+
+    # The finish of job 0 is set again after the finish of job 2
+    state.set_finish(state.slots[0], 10)
+    assert state.finished(9) == [jobs[3]]
+    assert state.finished(10) == [jobs[3], jobs[1], jobs[2], jobs[0]]
@@ -0,0 +1,69 @@
+import pytest
+
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+
+
+class CountingScheduler(FIFOScheduler):
+
+    def __init__(self):
+        FIFOScheduler.__init__(self)
+        self.passes = 0
+
+    def deploy(self) -> bool:
+        self.passes += 1
+        return FIFOScheduler.deploy(self)
+
+@pytest.fixture
+def blocked_pair(make_job, make_engine):
+    jobs = [make_job(job_name="load", num_of_processes=8) for _ in range(2)]
+    return make_engine(jobs, scheduler=CountingScheduler())
+
+def test_failed_pass_is_skipped_until_state_changes(blocked_pair):
+    compeng = blocked_pair
+
+    # Time steps where no job arrives or finishes
+    compeng.goto_next_sim_state = lambda: None
+
+    # The first job is deployed and the second one cannot fit
+    compeng.sim_step()
+    compeng.sim_step()
+    assert compeng.scheduler.passes == 2
+    assert compeng.failed_version == compeng.state_version
+
+    # Nothing changed since the failed pass
+    compeng.sim_step()
+    assert compeng.scheduler.passes == 2
+
+    # The first job finishes and the second one is deployed
+    del compeng.goto_next_sim_state
+    compeng.sim_step()
+    compeng.sim_step()
+    assert compeng.scheduler.passes == 3
+    assert compeng.cluster.waiting_queue == []
+
+def test_time_dependent_scheduler_repeats_passes(blocked_pair):
+    compeng = blocked_pair
+    compeng.goto_next_sim_state = lambda: None
+    compeng.scheduler.time_dependent = True
+
+    compeng.sim_step()
+    compeng.sim_step()
+    compeng.sim_step()
+    assert compeng.scheduler.passes == 3
+
+def test_arrivals_behind_a_blocked_head_skip_passes(make_job, make_engine, run_to_end, start_times):
+    def arrivals_behind_blocked_head():
+        return [make_job(job_name="load", num_of_processes=procs, submit_time=submit)
+                for procs, submit in [(8, 0), (8, 0), (4, 1), (4, 2), (4, 3)]]
+
+    compeng = run_to_end(make_engine(arrivals_behind_blocked_head(), scheduler=CountingScheduler()))
+    starts = start_times(compeng.logger)
+
+    # The passes at the arrivals of jobs 2, 3 and 4 are skipped
+    assert compeng.scheduler.passes == 7
+    assert starts == {0: 0, 1: 10, 2: 20, 3: 20, 4: 30}
+
+    repeating = make_engine(arrivals_behind_blocked_head(), scheduler=CountingScheduler())
+    repeating.scheduler.time_dependent = True
+    assert start_times(run_to_end(repeating).logger) == starts
+    assert repeating.scheduler.passes == 10
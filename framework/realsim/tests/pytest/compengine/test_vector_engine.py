@@ -0,0 +1,39 @@
+import pytest
+import random
+
+from realsim.compengine import ComputeEngine, VectorComputeEngine
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+from realsim.scheduler.schedulers.easy import EASYScheduler
+from realsim.scheduler.schedulers.conservative import ConservativeScheduler
+from realsim.scheduler.coschedulers.ranks.filler import FillerCoscheduler
+
+
+@pytest.fixture
+def run(make_job, make_engine, run_to_end):
+    heatmap = {f"load{i}": {f"load{j}": 0.8 + 0.15 * ((i + 2 * j) % 4) for j in range(4)}
+               for i in range(4)}
+
+    def workload():
+        rand = random.Random(7)
+        jobs = list()
+        submit = 0.0
+        for _ in range(60):
+            submit += rand.choice([0, 0, 5, 13.7])
+            wall_time = rand.uniform(20, 300)
+            jobs.append(make_job(job_name=f"load{rand.randrange(4)}",
+                                 num_of_processes=rand.choice([2, 4, 8, 16]),
+                                 remaining_time=wall_time * rand.uniform(0.5, 1),
+                                 submit_time=submit,
+                                 wall_time=wall_time))
+        return jobs
+
+    def run(engine, scheduler):
+        compeng = run_to_end(make_engine(workload(), heatmap, 4, (4, 4), scheduler, engine=engine))
+        return compeng.cluster.makespan, [array.tolist() for array in compeng.logger.events.job_times()]
+
+    return run
+
+@pytest.mark.parametrize("scheduler", [FIFOScheduler, EASYScheduler, ConservativeScheduler, FillerCoscheduler])
+def test_vector_engine_matches_default_engine(run, scheduler):
+    makespan, times = run(ComputeEngine, scheduler())
+    assert run(VectorComputeEngine, scheduler()) == (makespan, times)
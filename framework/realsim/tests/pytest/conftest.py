@@ -0,0 +1,89 @@
+import pytest
+import sys
+import os
+
+# API
+sys.path.append(os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "../../../../"
+)))
+
+# REALSIM
+sys.path.append(os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "../../../"
+)))
+
+from realsim.jobs.jobs import Job
+from realsim.database import Database
+from realsim.cluster.cluster import Cluster
+from realsim.logger.logger import Logger
+from realsim.compengine import ComputeEngine
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+
+
+@pytest.fixture
+def make_job():
+    """Factory of jobs; a job is named after its id unless a name is given
+    and its wall time is its remaining time unless given
+    """
+    def make_job(job_id=None, remaining_time=10, submit_time=0, job_name=None,
+                 num_of_processes=1, wall_time=None):
+        return Job(job_id,
+                   job_name if job_name is not None else f"job{job_id}",
+                   num_of_processes,
+                   [],
+                   remaining_time,
+                   submit_time,
+                   0,
+                   wall_time if wall_time is not None else remaining_time)
+    return make_job
+
+@pytest.fixture
+def make_logger():
+    """Factory of loggers set up for a cluster that never ran
+    """
+    def make_logger(nodes=2, socket_conf=(2, 2), **kwargs):
+        logger = Logger(**kwargs)
+        logger.cluster = Cluster(nodes, socket_conf)
+        logger.setup()
+        return logger
+    return make_logger
+
+@pytest.fixture
+def make_engine():
+    """Factory of compute engines with their database, cluster, scheduler and
+    logger set up for the jobs given
+    """
+    def make_engine(jobs, heatmap=None, nodes=2, socket_conf=(2, 2), scheduler=None,
+                    logger=None, engine=ComputeEngine):
+        database = Database(jobs, heatmap if heatmap is not None else {"load": {"load": 1.0}})
+        database.setup()
+        cluster = Cluster(nodes, socket_conf)
+        scheduler = scheduler if scheduler is not None else FIFOScheduler()
+        logger = logger if logger is not None else Logger()
+        compeng = engine(database, cluster, scheduler, logger)
+        compeng.setup_preloaded_jobs()
+        cluster.setup()
+        scheduler.setup()
+        logger.setup()
+        return compeng
+    return make_engine
+
+@pytest.fixture
+def run_to_end():
+    """Run the simulation of a compute engine until every job finished
+    """
+    def run_to_end(compeng):
+        while (compeng.db.has_pending_arrivals() or compeng.cluster.waiting_queue != []
+               or compeng.cluster.execution_list != []):
+            compeng.sim_step()
+        return compeng
+    return run_to_end
+
+@pytest.fixture
+def start_times():
+    """The start time of each job by job id from the events of a logger
+    """
+    def start_times(logger):
+        job_ids, _, start, _, _ = logger.events.job_times()
+        return dict(zip(job_ids.tolist(), start.tolist()))
+    return start_times
@@ -0,0 +1,75 @@
+import pytest
+
+import numpy as np
+from realsim.database import Database
+
+
+def test_jobs_are_pulled_on_release(make_job):
+    def make_jobs(pulled):
+        for i, name in enumerate(["a", "b", "c", "a"]):
+            pulled.append(i)
+            yield make_job(job_name=name, submit_time=10 * i)
+
+    pulled = list()
+    database = Database(make_jobs(pulled), {"a": {"a": 1.1, "b": 0.9}})
+    database.setup()
+
+    # Only the next arrival is materialized
+    assert pulled == [0]
+    assert database.peek_arrival().submit_time == 0
+
+    assert [job.submit_time for job in database.release_arrivals(15)] == [0, 10]
+    assert pulled == [0, 1, 2]
+    assert database.has_pending_arrivals()
+
+    assert len(database.release_arrivals(100)) == 2
+    assert not database.has_pending_arrivals()
+
+def test_unsorted_stream_is_rejected(make_job):
+    stream = (make_job(job_name="a", submit_time=time) for time in [0, 20, 10])
+    database = Database(stream, {"a": {"a": 1.0}})
+    database.setup()
+
+    assert [job.submit_time for job in database.release_arrivals(0)] == [0]
+    with pytest.raises(ValueError):
+        database.release_arrivals(20)
+
+def test_lists_are_sorted_and_copied(make_job):
+    jobs = [make_job(job_name="a", submit_time=20), make_job(job_name="b", submit_time=5)]
+    database = Database(jobs, {"a": {"a": 1.1}})
+    database.setup()
+
+    released = database.release_arrivals(100)
+    assert [job.submit_time for job in released] == [5, 20]
+    assert released[0] is not jobs[1] and released[1] is not jobs[0]
+
+def test_unknown_load_is_registered_on_arrival(make_job):
+    database = Database([make_job(job_name="c")], {"a": {"a": 1.1}})
+    database.setup()
+
+    job = database.release_arrivals(0)[0]
+    job.job_id = 0
+    database.register_job(job)
+
+    assert database.load_names == ["a", "c"]
+    assert database.speedups.shape == (2, 2)
+    assert np.isnan(database.speedups[job.load_id]).all()
+    assert database.max_speedups[job.load_id] == 1.0
+    assert database.min_speedups[job.load_id] == 1.0
+    assert database.avg_speedups[job.load_id] == 1.0
+    assert database.std_speedups[job.load_id] == 0.0
+
+def test_load_without_known_speedups_is_neutral():
+    database = Database([], {"a": {"a": 1.2, "b": 0.8}, "b": {"a": None, "b": None}})
+    database.setup()
+
+    a = database.load_ids["a"]
+    b = database.load_ids["b"]
+    assert database.max_speedups[a] == 1.2
+    assert database.min_speedups[a] == 0.8
+    assert np.isclose(database.avg_speedups[a], 1.0)
+    assert np.isclose(database.std_speedups[a], 0.2)
+    assert database.max_speedups[b] == 1.0
+    assert database.min_speedups[b] == 1.0
+    assert database.avg_speedups[b] == 1.0
+    assert database.std_speedups[b] == 0.0
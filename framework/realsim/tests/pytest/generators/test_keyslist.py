@@ -0,0 +1,27 @@
+import pytest
+
+from api.loader import Load, LoadManager
+from realsim.generators.keyslist import KeysListGenerator
+from realsim.jobs.swf import SWF_CSV_HEADER
+
+
+@pytest.fixture
+def generator():
+    lm = LoadManager("machine", "suite")
+    load = Load("cg.D.64", 64, "machine", "suite")
+    load.compact_timelogs = [100.0]
+    lm.loads["cg.D.64"] = load
+    return KeysListGenerator(lm)
+
+def test_wall_times_are_taken_as_given(generator):
+    trace = SWF_CSV_HEADER
+    trace += "0,0.0,,,,,,64,150.0,,1,,,cg.D.64,,,,\n"
+    trace += "1,10.0,,,,,,64,-1,,1,,,cg.D.64,,,,\n"
+    jobs = generator.generate_jobs_set(trace)
+
+    assert [job.submit_time for job in jobs] == [0.0, 10.0]
+    assert [job.wall_time for job in jobs] == [150.0, -1.0]
+
+def test_keys_are_load_names(generator):
+    with pytest.raises(KeyError):
+        generator.generate_jobs_set(SWF_CSV_HEADER + "0,0.0,,,,,,64,150.0,,1,,,4,,,,\n")
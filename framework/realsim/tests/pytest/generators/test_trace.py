@@ -0,0 +1,66 @@
+import pytest
+
+from api.loader import Load, LoadManager
+from realsim.jobs.swf import SWF_CSV_HEADER
+from realsim.generators.trace import TraceGenerator
+
+
+@pytest.fixture
+def generator():
+    lm = LoadManager("machine", "suite")
+    for name, procs, time in [("cg.D.64", 64, 100.0), ("sp.D.121", 121, 200.0)]:
+        load = Load(name, procs, "machine", "suite")
+        load.compact_timelogs = [time]
+        lm.loads[name] = load
+    return TraceGenerator(lm)
+
+def test_csv_dialect(generator):
+    trace = SWF_CSV_HEADER
+    trace += "0,0.0,,,,,,64,150.0,,1,,,cg.D.64,,,,\n"
+    trace += "1,10.0,,,,,,121,,,1,,,sp.D.121,,,,\n"
+    jobs = generator.generate_jobs_set(trace)
+
+    assert [job.job_name for job in jobs] == ["cg.D.64", "sp.D.121"]
+    assert [job.submit_time for job in jobs] == [0.0, 10.0]
+    # A missing requested time falls back to the default estimation
+    assert [job.wall_time for job in jobs] == [150.0, 250.0]
+
+def test_swf_file_is_streamed(generator, tmp_path):
+    path = tmp_path / "trace.swf"
+    path.write_text("; Comment of the archive\n"
+                    "1 0 5 100 64 -1 -1 64 120 -1 1 3 1 4 1 -1 -1 -1\n"
+                    "2 30 5 100 64 -1 -1 64 -1 -1 1 3 1 7 1 -1 -1 -1\n")
+
+    generator = TraceGenerator(generator.load_manager, executables={4: "cg.D.64", 7: "sp.D.121"})
+    stream = generator.generate_jobs_stream(str(path))
+    job = next(stream)
+    assert (job.job_id, job.job_name, job.wall_time) == (1, "cg.D.64", 120.0)
+    job = next(stream)
+    assert (job.job_id, job.job_name, job.submit_time) == (2, "sp.D.121", 30.0)
+    assert list(stream) == []
+
+def test_unknown_load_name(generator):
+    with pytest.raises(KeyError):
+        generator.generate_jobs_set("0,0,,,,,,1,1,,1,,,lu.E.512,,,,\n")
+
+def test_executable_numbers(generator):
+    trace = ("1 0 5 100 8 -1 -1 8 120 -1 1 3 1 4 1 -1 -1 -1\n"
+             "2 0 5 100 8 -1 -1 8 120 -1 1 3 1 7 1 -1 -1 -1\n")
+
+    # The numbers of a real trace must be mapped to loads
+    with pytest.raises(KeyError):
+        generator.generate_jobs_set(trace)
+
+    # The processes come from the load and not from the trace
+    mapped = TraceGenerator(generator.load_manager, executables={4: "sp.D.121", 7: "cg.D.64"})
+    jobs = mapped.generate_jobs_set(trace)
+    assert [job.job_name for job in jobs] == ["sp.D.121", "cg.D.64"]
+    assert [job.num_of_processes for job in jobs] == [121, 64]
+
+def test_jobs_do_not_share_tags(generator):
+    trace = ("0,0,,,,,,64,,,1,,,cg.D.64,,,,\n"
+             "1,0,,,,,,64,,,1,,,cg.D.64,,,,\n")
+    first, second = generator.generate_jobs_set(trace)
+
+    assert first.job_tag == second.job_tag
+    assert first.job_tag is not second.job_tag
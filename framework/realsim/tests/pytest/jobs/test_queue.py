@@ -0,0 +1,30 @@
+import pytest
+
+from realsim.jobs.queue import JobQueue
+
+
+@pytest.fixture
+def queue(make_job):
+    return JobQueue([make_job(i) for i in range(5)])
+
+def test_list_like_access(queue):
+    assert len(queue) == 5
+    assert queue[0].job_id == 0
+    assert queue[-1].job_id == 4
+    assert [job.job_id for job in queue[1:3]] == [1, 2]
+    assert [job.job_id for job in queue[:None]] == [0, 1, 2, 3, 4]
+    assert queue != []
+    assert JobQueue() == []
+
+def test_remove_by_id_keeps_order(queue, make_job):
+    # A copy of a job removes the stored one
+    queue.remove(make_job(2).deepcopy())
+    assert [job.job_id for job in queue] == [0, 1, 3, 4]
+    assert make_job(2) not in queue
+    assert queue.get(3).job_id == 3
+    assert queue.get(2) is None
+
+def test_append_goes_last(queue, make_job):
+    queue.remove(queue[0])
+    queue.append(make_job(0))
+    assert [job.job_id for job in queue] == [1, 2, 3, 4, 0]
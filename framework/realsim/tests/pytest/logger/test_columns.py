@@ -0,0 +1,76 @@
+import pytest
+
+import numpy as np
+from procset import ProcSet
+from realsim.logger.columns import EventColumns, interval_series
+
+
+def test_columns_grow():
+    events = EventColumns(capacity=2)
+    for job_id in range(5):
+        events.arrival(job_id, job_id, f"job{job_id}", 1, 10)
+    assert len(events) == 5
+    assert list(events.job[:len(events)]) == [0, 1, 2, 3, 4]
+
+def test_job_views():
+    events = EventColumns()
+    events.arrival(7, 2, "jobA", 4, 20)
+    events.arrival(3, 5, "jobB", 2, 10)
+    events.start(7, 6, 0, ProcSet((1, 2)))
+    events.start(7, 6, 1, ProcSet((9, 10)))
+    events.finish(7, 18)
+
+    views = events.job_views(["host0", "host1"])
+    assert list(views.keys()) == [7, 3]
+
+    view = views[7]
+    assert view["job name"] == "jobA"
+    assert view["submit time"] == 2
+    assert view["start time"] == 6
+    assert view["waiting time"] == 4
+    assert view["finish time"] == 18
+    assert view["assigned procs"] == ProcSet((1, 2), (9, 10))
+    assert view["hosts"] == {"host0", "host1"}
+
+    # A job that never started keeps the default times
+    assert views[3]["start time"] == 0
+    assert views[3]["assigned procs"] == ProcSet()
+
+def test_interval_series():
+    begins = np.array([0., 2., 5., 7.])
+    ends = np.array([4., 6., 5., 0.])
+    checkpoints = np.array([0., 2., 4., 5., 6.])
+    # The empty and the reversed intervals are not counted
+    assert interval_series(begins, ends, checkpoints).tolist() == [1, 2, 1, 1, 0]
+    weights = np.array([3, 2, 8, 1])
+    assert interval_series(begins, ends, checkpoints, weights).tolist() == [3, 5, 2, 2, 0]
+
+def test_job_times():
+    events = EventColumns()
+    events.arrival(7, 2, "jobA", 4, 20)
+    events.arrival(3, 5, "jobB", 2, 10)
+    events.start(3, 6, 0, ProcSet((1, 2), (5, 5)))
+    events.finish(3, 9)
+
+    job_ids, submit, start, finish, cores = events.job_times()
+    assert job_ids.tolist() == [7, 3]
+    assert submit.tolist() == [2, 5]
+    assert start.tolist() == [0, 6]
+    assert finish.tolist() == [0, 9]
+    assert cores.tolist() == [0, 3]
+
+def test_occupancy_applies_deltas():
+    events = EventColumns()
+    events.arrival(5, 0, "jobA", 2, 10)
+    events.arrival(6, 0, "jobB", 2, 10)
+    events.start(5, 0, 0, ProcSet((1, 2)))
+    # The second job takes the cores of the first one when it finishes
+    events.finish(5, 4)
+    events.start(6, 4, 0, ProcSet((1, 1), (3, 3)))
+    events.finish(6, 8)
+
+    frames = [grid.tolist() for grid in events.occupancy([0, 2, 4, 8], 4)]
+    assert frames == [[0, 0, -1, -1],
+                      [0, 0, -1, -1],
+                      [1, -1, 1, -1],
+                      [-1, -1, -1, -1]]
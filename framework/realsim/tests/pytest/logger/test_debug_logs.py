@@ -0,0 +1,37 @@
+import pytest
+import logging
+
+import realsim.logger.logevts as evts
+
+
+def test_logs_are_rendered_on_read(make_logger, make_job):
+    logger = make_logger()
+    job = make_job(3, job_name="load", num_of_processes=4)
+    logger.cluster.makespan = 61
+    logger.log(evts.JobDeployedToHost, job=job, hostname="host0")
+    logger.log(evts.CompEngineNextTimeStep, time_step=5)
+
+    assert logger.records[0] == (evts.JobDeployedToHost, 61, (3, "load", "host0"))
+    assert logger.cluster_logs == ["(0:01:01)    Job deployed to host [3:load in-> host0]"]
+    assert logger.compeng_logs == ["(0:01:01)    Calculated the simulation time step [5]"]
+    assert logger.job_logs == []
+
+def test_level_filter(make_logger):
+    logger = make_logger(level=logging.INFO)
+    logger.log(evts.CompEngineNextTimeStep, time_step=5)
+    assert len(logger.records) == 0
+
+def test_capacity_keeps_the_latest_records(make_logger):
+    logger = make_logger(capacity=2)
+    for time_step in range(5):
+        logger.log(evts.CompEngineNextTimeStep, time_step=time_step)
+    assert [line[-3:] for line in logger.get_logs()] == ["[3]", "[4]"]
+
+def test_logs_show_the_state_when_logged(make_logger, make_job):
+    logger = make_logger()
+    job = make_job(3, job_name="load", num_of_processes=4)
+    logger.log(evts.JobArrival, job=job)
+
+    # A later change of the job does not change its past logs
+    job.job_name = "renamed"
+    assert logger.job_logs == ["(0:00:00)    Job arrived in the waiting queue [3:load]"]
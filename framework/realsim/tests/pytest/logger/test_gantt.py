@@ -0,0 +1,50 @@
+import pytest
+import json
+from procset import ProcSet
+
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+
+
+@pytest.fixture
+def logger(make_job, make_engine, run_to_end):
+    jobs = [make_job(job_name="load", num_of_processes=4, remaining_time=10 + i, submit_time=i, wall_time=20)
+            for i in range(6)]
+    return run_to_end(make_engine(jobs, nodes=4)).logger
+
+def test_compact_gantt_has_a_trace_per_bucket(logger):
+    full = json.loads(logger.get_gantt_representation())["data"]
+    compact = json.loads(logger.get_gantt_representation(compact=True, buckets=2))["data"]
+
+    assert len(full) == sum(len(list(jevt["assigned procs"].intervals())) for jevt in logger.job_events.values())
+    # Two colour buckets and the hover points of the jobs
+    assert len(compact) == 3
+    assert len(compact[-1]["x"]) == 6
+    # Five vertices and a gap for each rectangle
+    assert sum(len(trace["x"]) for trace in compact[:-1]) == 6 * len(full)
+
+def test_compact_gantt_drops_subpixel_intervals(make_logger):
+    logger = make_logger(4)
+    logger.scheduler = FIFOScheduler()
+    logger.events.arrival(0, 0, "load", 9, 10)
+    logger.events.start(0, 0, 0, ProcSet((1, 8), (10, 10)))
+    logger.events.finish(0, 10)
+
+    # Both intervals are drawn at full resolution
+    compact = json.loads(logger.get_gantt_representation(compact=True))["data"]
+    assert compact[0]["y"] == [1, 1, 8, 8, 1, None, 10, 10, 10, 10, 10, None]
+
+    # Four pixels for sixteen cores hide the single core; the gap between
+    # the intervals is not filled
+    compact = json.loads(logger.get_gantt_representation(compact=True, pixels=4))["data"]
+    assert compact[0]["y"] == [1, 1, 8, 8, 1, None]
+
+def test_compact_gantt_keeps_a_rectangle_per_job(make_logger):
+    logger = make_logger(4)
+    logger.scheduler = FIFOScheduler()
+    logger.events.arrival(0, 0, "load", 4, 10)
+    logger.events.start(0, 0, 0, ProcSet((1, 2), (4, 5)))
+    logger.events.finish(0, 10)
+
+    compact = json.loads(logger.get_gantt_representation(compact=True, pixels=4))["data"]
+    assert compact[0]["y"] == [1, 1, 2, 2, 1, None]
+    assert len(compact[-1]["x"]) == 1
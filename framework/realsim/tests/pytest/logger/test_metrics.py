@@ -0,0 +1,52 @@
+import pytest
+import random
+
+import numpy as np
+from realsim.logger.logger import Logger
+from realsim.logger.metrics import P2Quantile, OnlineMetrics
+
+
+@pytest.fixture
+def run(make_job, make_engine, run_to_end):
+    def run(retain):
+        jobs = [make_job(job_name="load", num_of_processes=4 * (1 + i % 3), remaining_time=10 + i,
+                         submit_time=i, wall_time=20) for i in range(12)]
+        logger = Logger(retain=retain, sinks=[OnlineMetrics(bound=5)])
+        return run_to_end(make_engine(jobs, nodes=4, logger=logger)).logger
+    return run
+
+def test_p2_quantile_estimation():
+    rand = random.Random(7)
+    values = [rand.expovariate(1) for _ in range(5000)]
+    for p in [0.5, 0.95]:
+        quantile = P2Quantile(p)
+        for value in values:
+            quantile.add(value)
+        assert quantile.value() == pytest.approx(np.quantile(values, p), rel=0.05)
+
+def test_p2_quantile_few_observations():
+    quantile = P2Quantile(0.5)
+    for value in [3, 1, 2]:
+        quantile.add(value)
+    assert quantile.value() == 2
+
+def test_online_metrics_match_the_events(run):
+    logger = run(retain=True)
+    metrics = logger.get_metrics()
+    jevts = list(logger.job_events.values())
+
+    waiting = [jevt["waiting time"] for jevt in jevts]
+    slowdown = [max((jevt["finish time"] - jevt["submit time"]) / max(jevt["finish time"] - jevt["start time"], 5), 1)
+                for jevt in jevts]
+    core_seconds = sum(len(jevt["assigned procs"]) * (jevt["finish time"] - jevt["start time"]) for jevt in jevts)
+
+    assert metrics["finished jobs"] == 12
+    assert metrics["makespan"] == logger.cluster.makespan
+    assert metrics["mean waiting time"] == pytest.approx(np.mean(waiting))
+    assert metrics["mean bounded slowdown"] == pytest.approx(np.mean(slowdown))
+    assert metrics["utilization"] == pytest.approx(core_seconds / (16 * logger.cluster.makespan))
+
+def test_metrics_without_retained_events(run):
+    logger = run(retain=False)
+    assert len(logger.events) == 0
+    assert logger.get_metrics() == run(retain=True).get_metrics()
@@ -0,0 +1,40 @@
+import pytest
+import pickle
+
+import numpy as np
+from realsim.logger.summary import JobsSummary
+
+
+@pytest.fixture
+def logged(make_logger):
+    """Factory of loggers with the (submit, start, finish) times of jobs
+    """
+    def logged(times):
+        logger = make_logger()
+        for job_id, [submit, start, finish] in times.items():
+            logger.events.arrival(job_id, submit, f"job{job_id}", 1, 10)
+            logger.events.finish(job_id, finish)
+        for job_id, [submit, start, finish] in times.items():
+            logger.events.append(job_id, logger.events.START, start, 0, 1, 1)
+        logger.cluster.makespan = max(finish for _, _, finish in times.values())
+        return logger
+    return logged
+
+def test_summary_is_sorted_by_job_id(logged):
+    summary = logged({5: (0, 1, 4), 2: (0, 0, 2)}).get_jobs_summary()
+    assert summary.job_ids.tolist() == [2, 5]
+    assert summary.finish.tolist() == [2, 4]
+    assert summary.makespan == 4
+    with pytest.raises(KeyError):
+        summary.positions(np.array([3]))
+
+def test_utilization_against_summary(logged):
+    baseline = logged({5: (0, 1, 5), 2: (0, 0, 2)})
+    logger = logged({5: (0, 0, 2), 2: (0, 1, 3)})
+
+    # A pickled summary gives the same points as the baseline logger
+    summary = pickle.loads(pickle.dumps(baseline.get_jobs_summary()))
+    points = logger.get_jobs_utilization(summary)
+    assert points == logger.get_jobs_utilization(baseline)
+    assert points["5:job5"] == {"speedup": 2.0, "turnaround": 2.5, "waiting": 1.0}
+    assert points["2:job2"] == {"speedup": 1.0, "turnaround": 2 / 3, "waiting": -1.0}
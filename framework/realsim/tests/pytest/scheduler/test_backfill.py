@@ -0,0 +1,44 @@
+import pytest
+
+from realsim.scheduler.schedulers.easy import EASYScheduler
+from realsim.scheduler.schedulers.conservative import ConservativeScheduler
+
+
+@pytest.fixture
+def schedule(make_job, make_engine, run_to_end, start_times):
+    # Hosts of 4 cores; the number of processes / 4 is the number of nodes
+    jobs = [make_job(job_name="load", num_of_processes=procs, remaining_time=time)
+            for procs, time in [(8, 100), (12, 50), (4, 200), (4, 120), (4, 80)]]
+
+    def schedule(scheduler):
+        return start_times(run_to_end(make_engine(jobs, nodes=4, scheduler=scheduler)).logger)
+
+    return schedule
+
+def test_conservative_reserves_every_queued_job(schedule):
+    # The blocked job 1 is reserved at 100 and leaves a node free from 100
+    # to 150; job 2 backfills on it, job 3 would delay job 1 and is reserved
+    # at 150 and job 4 ends before the reservation of job 1
+    assert schedule(ConservativeScheduler()) == {0: 0, 1: 100, 2: 0, 3: 150, 4: 0}
+
+def test_easy_backfills_jobs_that_end_before_the_blocked_job(schedule):
+    # Only job 4 ends before the estimated start of job 1
+    assert schedule(EASYScheduler()) == {0: 0, 1: 100, 2: 100, 3: 150, 4: 0}
+
+def test_conservative_reserves_a_job_that_fails_to_allocate_now(make_job, make_engine,
+                                                               run_to_end, start_times):
+
+    class PickyScheduler(ConservativeScheduler):
+        # Job 2 fits in the free nodes at 0 but not in their sockets
+        def compact_allocation(self, job):
+            if job.job_id == 2 and self.cluster.makespan == 0:
+                return False
+            return super().compact_allocation(job)
+
+    jobs = [make_job(job_name="load", num_of_processes=procs, remaining_time=time)
+            for procs, time in [(8, 100), (12, 50), (4, 40), (4, 200)]]
+    logger = run_to_end(make_engine(jobs, nodes=4, scheduler=PickyScheduler())).logger
+
+    # Job 2 is reserved at 100 next to the blocked job 1, so job 3 cannot
+    # start at 0 and take the node that job 2 needs at 100
+    assert start_times(logger) == {0: 0, 1: 100, 2: 100, 3: 140}
@@ -0,0 +1,33 @@
+import pytest
+
+from realsim.scheduler.coschedulers.ranks.random import RandomRanksCoscheduler
+
+
+heatmap = {
+    "a": {"a": 1.2, "b": 0.8, "c": None},
+    "b": {"a": 1.3, "b": 0.9, "c": 1.1},
+    "c": {"a": 1.0, "b": 1.2, "c": 1.1},
+}
+
+@pytest.fixture
+def compeng(make_job, make_engine):
+    names = ["a", "b", "c", "a", "b", "c", "a"]
+    jobs = [make_job(job_name=name, num_of_processes=64, submit_time=i) for i, name in enumerate(names)]
+    return make_engine(jobs, heatmap, scheduler=RandomRanksCoscheduler())
+
+def test_incremental_ranks_match_full_recomputation(compeng):
+    scheduler = compeng.scheduler
+    for time in range(7):
+        compeng.cluster.makespan = time
+        compeng.load_in_waiting_queue()
+        ranks = dict(scheduler.ranks)
+        scheduler.update_ranks()
+        assert ranks == scheduler.ranks
+
+    # Jobs leave the waiting queue
+    for job in compeng.cluster.waiting_snapshot(0, 3):
+        compeng.cluster.waiting_queue.remove(job)
+        scheduler.waiting_queue_departure(job)
+        ranks = dict(scheduler.ranks)
+        scheduler.update_ranks()
+        assert ranks == scheduler.ranks
@@ -0,0 +1,80 @@
+import pytest
+
+from realsim.jobs.jobs import Job, JobView
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+from realsim.scheduler.coschedulers.rulebased.rules import RulesCoscheduler
+
+
+@pytest.fixture
+def queued(make_job, make_engine):
+    """A compute engine with a single job of num_of_processes in the queue
+    """
+    def queued(num_of_processes, scheduler=None):
+        compeng = make_engine([make_job(job_name="load", num_of_processes=num_of_processes)],
+                              scheduler=scheduler)
+        compeng.load_in_waiting_queue()
+        return compeng
+    return queued
+
+def test_snapshot_views_are_read_only(queued):
+    compeng = queued(4)
+    view, = compeng.cluster.waiting_snapshot()
+
+    assert view.job_id == 0 and view.num_of_processes == 4
+    with pytest.raises(AttributeError):
+        view.socket_conf = (1, 1)
+    assert compeng.cluster.waiting_queue[0].socket_conf == tuple()
+
+def test_allocation_changes_the_job_behind_a_view(queued):
+    compeng = queued(4)
+    job = compeng.cluster.waiting_queue[0]
+    view, = compeng.cluster.waiting_snapshot()
+
+    assert compeng.scheduler.compact_allocation(view)
+    assert compeng.cluster.waiting_queue == []
+    assert compeng.cluster.execution_list[0] is job
+    assert job.socket_conf == compeng.cluster.full_socket_allocation
+    assert JobView.unwrap(compeng.cluster.execution_snapshot()[0]) is job
+
+def test_failed_allocation_leaves_the_job_untouched(queued):
+    compeng = queued(16)
+    job = compeng.cluster.waiting_queue[0]
+
+    assert not compeng.scheduler.allocation(job, (1, 1))
+    assert job.socket_conf == tuple()
+
+def test_host_ranking_sees_the_socket_configuration(queued):
+    seen = list()
+
+    class RankingScheduler(FIFOScheduler):
+        def host_alloc_condition(self, hostname, job):
+            seen.append(job.socket_conf)
+            return 0.0
+
+    compeng = queued(4, RankingScheduler())
+    assert compeng.scheduler.allocation(compeng.cluster.waiting_queue[0], (1, 1))
+    assert seen and set(seen) == {(1, 1)}
+
+def test_failed_deployment_keeps_the_jobs_of_the_queue(make_job, make_engine):
+
+    class CompactRules(RulesCoscheduler):
+        def colocation_to_xunit(self, job):
+            return False
+        def colocation_with_wjobs(self, job, waiting_queue):
+            return False
+        def allocation_as_compact(self, job):
+            return self.compact_allocation(job) if job.job_name == "fits" else False
+
+    jobs = [make_job(job_name=name, num_of_processes=4, submit_time=0)
+            for name in ["fits", "blocked", "behind"]]
+    compeng = make_engine(jobs, heatmap={name: {} for name in ["fits", "blocked", "behind"]},
+                          scheduler=CompactRules())
+    compeng.load_in_waiting_queue()
+
+    assert compeng.scheduler.deploy()
+    waiting = list(compeng.cluster.waiting_queue)
+    assert [job.job_name for job in waiting] == ["blocked", "behind"]
+    assert all(type(job) is Job for job in waiting)
+
+    # The engine still updates the jobs left in the queue
+    waiting[0].start_time = 1
@@ -0,0 +1,13 @@
+import pytest
+
+import numpy as np
+from realsim.scheduler.scheduler import top_k
+
+
+def stable_sort(scores, k):
+    return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:k]
+
+@pytest.mark.parametrize("k", [1, 2, 3, 5, 8])
+def test_top_k_matches_stable_sort(k):
+    scores = np.array([1.0, 1.2, 0.9, 1.2, 1.0, 1.2, 0.8])
+    assert list(top_k(scores, k)) == stable_sort(scores, k)
@@ -0,0 +1,45 @@
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+from realsim.simulator import Simulation
+from realsim.scheduler.schedulers.fifo import FIFOScheduler
+from realsim.scheduler.schedulers.easy import EASYScheduler
+from realsim.scheduler.schedulers.conservative import ConservativeScheduler
+
+
+SCHEDULERS = [(FIFOScheduler, {}), (EASYScheduler, {}), (ConservativeScheduler, {})]
+
+@pytest.fixture
+def make_stream(make_job):
+    def make_stream():
+        for i in range(6):
+            yield make_job(remaining_time=10 + i, submit_time=5 * i, job_name="a",
+                           num_of_processes=2 + i % 3)
+    return make_stream
+
+def workload_sizes(results):
+    # The rows of the workload of each scheduler without its header
+    return {policy: len(data["Workload"].strip().split("\n")) - 1
+            for policy, data in results.items()}
+
+def test_generator_is_replayed_by_every_scheduler(make_stream):
+    sim = Simulation(make_stream(), {"a": {"a": 1.0}}, 2, (2, 2), -1, SCHEDULERS)
+    sim.run()
+
+    assert workload_sizes(sim.get_results()) == {
+            "FIFO Scheduler": 6, "EASY Scheduler": 6, "Conservative Scheduler": 6}
+
+def test_factory_gives_every_database_a_fresh_stream(make_stream):
+    calls = list()
+    def factory():
+        calls.append(None)
+        return make_stream()
+
+    with ThreadPoolExecutor() as executor:
+        sim = Simulation(factory, {"a": {"a": 1.0}}, 2, (2, 2), -1, SCHEDULERS,
+                         executor=executor)
+        sim.run()
+        results = sim.get_results()
+
+    assert len(calls) == len(SCHEDULERS)
+    assert set(workload_sizes(results).values()) == {6}